@@ -21,6 +21,9 @@ export default function Home() {
   const [error, setError] = useState<string | null>(null);
   const [quizAnswers, setQuizAnswers] = useState<QuizAnswers | null>(null);
   const [resultCount, setResultCount] = useState(0);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [lastQuery, setLastQuery] = useState<Parameters<typeof getJobs>[0]>({});
+  const [loadingMore, setLoadingMore] = useState(false);
   const [showUpgradeModal, setShowUpgradeModal] = useState(false);
   const [upgradeFeature, setUpgradeFeature] = useState('');
   
@@ -92,16 +95,19 @@ export default function Home() {
     setError(null);
     
     try {
-      const response = await getJobs({
+      const query = {
         search: filters.search,
         category: filters.category,
         no_phone: filters.noPhone,
         has_salary: filters.hasSalary,
         limit: 50,
-      });
+      };
+      const response = await getJobs(query);
       console.log('API response:', response);
       setJobs(response.jobs);
       setResultCount(response.count);
+      setLastQuery(query);
+      setNextCursor(response.next_cursor ?? null);
       changeView('results');
     } catch (err) {
       console.error('Search error:', err);
@@ -125,13 +131,17 @@ export default function Home() {
           : response.jobs;
         setJobs(filtered.length > 0 ? filtered : response.jobs);
         setResultCount(filtered.length > 0 ? filtered.length : response.count);
+        setNextCursor(null);
       } else {
-        const response = await getJobs({
+        const query = {
           category: answers.categories[0],
           limit: 50,
-        });
+        };
+        const response = await getJobs(query);
         setJobs(response.jobs);
         setResultCount(response.count);
+        setLastQuery(query);
+        setNextCursor(response.next_cursor ?? null);
       }
       changeView('results');
     } catch (err) {
@@ -141,6 +151,23 @@ export default function Home() {
     }
   };
   
+  // Fetch the page after the last loaded job (keyset cursor, stable across new scrapes)
+  const loadMore = async () => {
+    if (!nextCursor || loadingMore) return;
+    setLoadingMore(true);
+    
+    try {
+      const response = await getJobs({ ...lastQuery, cursor: nextCursor });
+      setJobs(prev => [...prev, ...response.jobs]);
+      setResultCount(prev => prev + response.count);
+      setNextCursor(response.next_cursor ?? null);
+    } catch (err) {
+      setError('Failed to fetch jobs. Make sure the API is running.');
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+  
   const categories = stats ? Object.keys(stats.by_category) : [];
   
   return (
@@ -488,11 +515,15 @@ export default function Home() {
                 )}
                 
                 {/* Load more for Pro users */}
-                {isPro && jobs.length >= 50 && (
+                {isPro && nextCursor && (
                   <div className="text-center py-8">
-                    <p className="text-text-muted">
-                      Showing first 50 results. Pagination coming soon! 🚀
-                    </p>
+                    <button
+                      onClick={loadMore}
+                      disabled={loadingMore}
+                      className="btn-primary disabled:opacity-60"
+                    >
+                      {loadingMore ? 'Loading...' : 'Load more jobs'}
+                    </button>
                   </div>
                 )}
               </>
@@ -104,9 +104,9 @@ export default function JobCard({ job }: JobCardProps) {
       </div>
       
       {/* Description preview */}
-      {job.description && (
+      {job.snippet && (
         <p className="text-text-secondary text-sm line-clamp-2 mb-4 leading-relaxed">
-          {job.description.substring(0, 180)}...
+          {job.snippet}
         </p>
       )}
       
@@ -5,15 +5,16 @@ const API_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
 export interface Job {
   id: string;
   source: string;
-  source_id: string;
+  source_id?: string;
   title: string;
   company: string;
   company_logo?: string;
-  description?: string;
+  snippet?: string;
+  description?: string;  // only on the single-job endpoint
   location: string;
   salary_min?: number;
   salary_max?: number;
-  salary_currency: string;
+  salary_currency?: string;
   url: string;
   apply_url?: string;
   tags: string[];
@@ -26,6 +27,7 @@ export interface Job {
 export interface JobsResponse {
   count: number;
   offset: number;
+  next_cursor?: string | null;
   jobs: Job[];
 }
 
@@ -51,6 +53,8 @@ export async function getJobs(params?: {
   search?: string;
   limit?: number;
   offset?: number;
+  cursor?: string;
+  fields?: string;
 }): Promise<JobsResponse> {
   const searchParams = new URLSearchParams();
   
@@ -61,14 +65,20 @@ export async function getJobs(params?: {
   if (params?.search) searchParams.set('search', params.search);
   if (params?.limit) searchParams.set('limit', params.limit.toString());
   if (params?.offset) searchParams.set('offset', params.offset.toString());
+  if (params?.cursor) searchParams.set('cursor', params.cursor);
+  // Without fields the API splices stored payloads, which beats trimming a few bytes
+  if (params?.fields) searchParams.set('fields', params.fields);
   
   const res = await fetch(`${API_URL}/api/jobs?${searchParams.toString()}`);
   if (!res.ok) throw new Error('Failed to fetch jobs');
   return res.json();
 }
 
-export async function getLazyGirlJobs(limit = 50): Promise<JobsResponse> {
-  const res = await fetch(`${API_URL}/api/lazy-girl-jobs?limit=${limit}`);
+export async function getLazyGirlJobs(limit = 50, cursor?: string): Promise<JobsResponse> {
+  const searchParams = new URLSearchParams({ limit: limit.toString() });
+  if (cursor) searchParams.set('cursor', cursor);
+  
+  const res = await fetch(`${API_URL}/api/lazy-girl-jobs?${searchParams.toString()}`);
   if (!res.ok) throw new Error('Failed to fetch lazy girl jobs');
   return res.json();
 }
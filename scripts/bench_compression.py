@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark bytes-on-wire and latency of /api/jobs?limit=200 per Accept-Encoding.
+
+Usage:
+    python scripts/bench_compression.py
+    python scripts/bench_compression.py --requests 500 --path "/api/jobs?limit=50"
+
+Runs the API in-process (data/jobs.db, seeded like a normal start) and
+compares two cache states for identity, gzip and brotli: cold (response
+cache disabled, so every request queries, builds and compresses) and warm
+(cache hits serving the stored, already-compressed variant).
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)
+
+from fastapi.testclient import TestClient
+
+from src import api
+from src.compression import BROTLI_AVAILABLE
+
+
+def run(client: TestClient, path: str, encoding: str, count: int) -> tuple[int, float, float]:
+    """Issue count requests; return (wire bytes of one response, p50 ms, p95 ms)."""
+    latencies = []
+    wire_bytes = 0
+    for _ in range(count):
+        start = time.perf_counter()
+        response = client.get(path, headers={"Accept-Encoding": encoding})
+        latencies.append((time.perf_counter() - start) * 1000)
+        wire_bytes = response.num_bytes_downloaded
+        response.raise_for_status()
+    latencies.sort()
+    return wire_bytes, statistics.median(latencies), latencies[int(len(latencies) * 0.95) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--path', default='/api/jobs?limit=200')
+    args = parser.parse_args()
+
+    encodings = ['identity', 'gzip'] + (['br'] if BROTLI_AVAILABLE else [])
+    client = TestClient(api.app)
+    max_entries = api.response_cache.max_entries
+
+    print(f"{'cache':<6} {'encoding':<9} {'bytes':>9} {'p50 ms':>8} {'p95 ms':>8}")
+    for label, entries in (('cold', 0), ('warm', max_entries)):
+        api.response_cache.max_entries = entries
+        api.response_cache.clear()
+        for encoding in encodings:
+            client.get(args.path, headers={"Accept-Encoding": encoding})  # prime
+            wire_bytes, p50, p95 = run(client, args.path, encoding, args.requests)
+            print(f"{label:<6} {encoding:<9} {wire_bytes:>9,} {p50:>8.2f} {p95:>8.2f}")
+
+    api.response_cache.max_entries = max_entries
+    if not BROTLI_AVAILABLE:
+        print("(brotli not installed; br skipped)")
+
+
+if __name__ == '__main__':
+    main()
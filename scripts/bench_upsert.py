@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-row upsert_job vs bulk_upsert_jobs on synthetic jobs.
+
+Usage:
+    python scripts/bench_upsert.py                  # 10k and 100k jobs
+    python scripts/bench_upsert.py --sizes 2000 10000
+
+Each size runs three passes per strategy against a fresh database: a cold
+pass (every job is new), a re-scrape pass (every job exists with changed
+content) and an unchanged pass (identical content, fingerprint-only touch).
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database import JobDatabase
+
+
+def make_jobs(count: int, generation: int = 0) -> list[dict]:
+    """Build `count` synthetic job dicts shaped like Job.to_dict()."""
+    now = datetime.utcnow().isoformat()
+    return [
+        {
+            'id': f"{i:016x}",
+            'source': ('remoteok', 'weworkremotely', 'reddit', 'wellfound')[i % 4],
+            'source_id': str(i),
+            'title': f"Customer Support Specialist #{i}",
+            'company': f"Company {i % 500}",
+            'company_logo': None,
+            'description': "Answer tickets over chat and email. " * 40,
+            'location': 'Remote',
+            'salary_min': 40000 + (i % 50) * 1000 + generation,
+            'salary_max': 60000 + (i % 50) * 1000,
+            'salary_currency': 'USD',
+            'url': f"https://example.com/jobs/{i}",
+            'apply_url': None,
+            'tags': json.dumps(['remote', 'support']),
+            'category': 'support',
+            'is_no_phone': i % 3 == 0,
+            'posted_at': now,
+            'scraped_at': now,
+        }
+        for i in range(count)
+    ]
+
+
+def run_per_row(db: JobDatabase, jobs: list[dict]) -> float:
+    start = time.perf_counter()
+    for job in jobs:
+        db.upsert_job(job)
+    return time.perf_counter() - start
+
+
+def run_bulk(db: JobDatabase, jobs: list[dict]) -> float:
+    start = time.perf_counter()
+    db.bulk_upsert_jobs(jobs)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    print(f"{'jobs':>8}  {'strategy':<10} {'pass':<10} {'seconds':>9} {'jobs/sec':>10}")
+
+    for size in args.sizes:
+        cold = make_jobs(size)
+        warm = make_jobs(size, generation=1)
+
+        for name, runner in (('per-row', run_per_row), ('bulk', run_bulk)):
+            with tempfile.TemporaryDirectory() as tmp:
+                db = JobDatabase(str(Path(tmp) / 'bench.db'))
+                for label, jobs in (('cold', cold), ('rescrape', warm), ('unchanged', warm)):
+                    elapsed = runner(db, jobs)
+                    print(f"{size:>8}  {name:<10} {label:<10} {elapsed:>9.2f} {size / elapsed:>10,.0f}")
+                db.close()
+
+
+if __name__ == '__main__':
+    main()
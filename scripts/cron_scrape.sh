@@ -14,6 +14,7 @@ source venv/bin/activate
 # Run scraper
 echo "Starting scrape at $(date)" >> "$LOG_FILE"
 python src/main.py scrape >> "$LOG_FILE" 2>&1
+python src/main.py archive >> "$LOG_FILE" 2>&1
 echo "Finished at $(date)" >> "$LOG_FILE"
 
 # Keep only last 10 log files
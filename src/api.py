@@ -10,19 +10,35 @@ from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import Optional
 from contextlib import contextmanager
+import hashlib
 import json
 import uuid
-import bcrypt
 import os
+import sqlite3
 import asyncio
 import shutil
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
 from pathlib import Path
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.database import JobDatabase
+from src.database import (
+    JobDatabase, ConnectionPool, encode_cursor, dumps_json, parse_fields,
+    LAZY_FEED_KEYS, LIST_COLUMNS, PAYLOAD_SELECT,
+)
+from src.archive import JobArchive
+from src.cache import ResponseCache
+from src.compression import CompressedBody, CompressionMiddleware, negotiate
+from src.hashing import PasswordHasher, HasherSaturated, HasherUnavailable
+from src.pipeline import StreamStats, finish_source, write_jobs, write_stream
+from src.scrape_manager import ScrapeManager, ScrapeRun, SourceRun
+from src.scrape_worker import SCRAPERS, stream_in_worker
+from src.scrapers import HttpCache, PageLog
+from src.export import iter_csv, iter_ndjson
 
 app = FastAPI(
     title="Remote Job Scraper API",
@@ -44,9 +60,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compresses uncached responses; cached ones arrive already encoded and pass through
+app.add_middleware(CompressionMiddleware)
+
 # --- Database setup ---
 
 DB_PATH = "data/jobs.db"
+ARCHIVE_PATH = "data/jobs_archive.db"
 SEED_DB = "seeds/jobs_seed.db"
 
 # Copy seed if jobs.db doesn't exist or has no job data (< 100KB means just schemas)
@@ -57,13 +77,84 @@ if not Path(DB_PATH).exists() or Path(DB_PATH).stat().st_size < 100_000:
         print(f"Copied seed database to {DB_PATH}")
 
 
+# Schema is bootstrapped once here; requests borrow pooled connections
+db_pool = ConnectionPool(DB_PATH)
+
+# Expired jobs moved out by `main.py archive`; only read here, for id lookups
+job_archive = JobArchive(ARCHIVE_PATH, read_only=True)
+
+
+@app.on_event("shutdown")
+def close_db_pool():
+    db_pool.close()
+    job_archive.close()
+
+
 def get_db():
-    """Get database connection per request."""
-    db = JobDatabase(DB_PATH)
-    try:
+    """Borrow a pooled read-only connection for the request."""
+    with db_pool.reader() as db:
         yield db
-    finally:
-        db.close()
+
+
+def get_writer_db():
+    """Hold the serialized writer connection for the request."""
+    with db_pool.writer() as db:
+        yield db
+
+
+# --- Response cache (read endpoints only change when a scrape finishes) ---
+
+response_cache = ResponseCache(
+    max_entries=int(os.environ.get("RESPONSE_CACHE_SIZE", "512")),
+    ttl=float(os.environ.get("RESPONSE_CACHE_TTL", "300")),
+)
+
+
+def _cached(endpoint: str, params: dict, db: JobDatabase, build, accept_encoding: Optional[str]) -> Response:
+    """
+    Serve build() from the response cache, keyed by endpoint, params and data version.
+
+    build returns a JSON-able value or ready JSON bytes. The cache keeps the
+    encoded body with its gzip/brotli variants, so a repeat hit sends stored
+    bytes in whichever encoding the client accepts.
+    """
+    def compute():
+        body = build()
+        return CompressedBody(body if isinstance(body, bytes) else dumps_json(body))
+
+    key = response_cache.make_key(endpoint, params)
+    cached = response_cache.get_or_compute(key, db.get_data_version(), compute)
+    content, encoding = cached.encode(negotiate(accept_encoding))
+    headers = {"Vary": "Accept-Encoding"}
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+def _jobs_body(rows: list[dict], **meta) -> bytes:
+    """
+    JSON body {**meta, "jobs": [...]} spliced together from the jobs' stored
+    api_json payloads, so a page costs no per-row parsing or encoding.
+    """
+    jobs = b",".join(row['api_json'][:-1] + b',"is_active":%d}' % row['is_active'] for row in rows)
+    return dumps_json(meta)[:-1] + b',"jobs":[' + jobs + b']}'
+
+
+def _projected_body(rows: list[dict], fields: tuple[str, ...], **meta) -> bytes:
+    """JSON body {**meta, "jobs": [...]} holding only the requested fields of each job."""
+    jobs = [_decode_tags({field: row[field] for field in fields}) for row in rows]
+    return dumps_json({**meta, "jobs": jobs})
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[tuple[str, ...]]:
+    """Validate a ?fields= value against the job column whitelist (400 on unknown names)."""
+    try:
+        return parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+FIELDS_QUERY = Query(None, description="Comma-separated job fields to return (default: all); id is always included")
 
 
 # --- Internal auth token (for server-to-server calls) ---
@@ -103,136 +194,256 @@ def get_jobs(
     has_salary: bool = Query(False, description="Only jobs with salary information"),
     search: Optional[str] = Query(None, description="Search in title, company, description"),
     limit: int = Query(50, ge=1, le=200, description="Number of results"),
-    offset: int = Query(0, ge=0, description="Offset for pagination"),
+    offset: int = Query(0, ge=0, description="Offset for pagination (ignored when cursor is set)"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous response's next_cursor"),
+    fields: Optional[str] = FIELDS_QUERY,
     db: JobDatabase = Depends(get_db),
+    accept_encoding: Optional[str] = Header(None),
 ):
     """Get job listings with optional filters."""
     if search:
-        jobs = db.search_jobs(search, limit=limit)
-    else:
-        jobs = db.get_jobs(
-            category=category,
-            source=source,
-            no_phone_only=no_phone,
-            has_salary=has_salary,
-            limit=limit,
-            offset=offset,
-        )
-
-    for job in jobs:
-        if job.get('tags') and isinstance(job['tags'], str):
+        search = " ".join(search.lower().split())
+    projection = _parse_fields(fields)
+    columns = PAYLOAD_SELECT if projection is None else tuple(dict.fromkeys(projection + ('scraped_at',)))
+
+    def build():
+        next_cursor = None
+        if search:
+            jobs = db.search_jobs(search, limit=limit, columns=columns)
+        else:
             try:
-                job['tags'] = json.loads(job['tags'])
-            except:
-                job['tags'] = []
-
-    return {
-        "count": len(jobs),
-        "offset": offset,
-        "jobs": jobs,
+                jobs = db.get_jobs(
+                    category=category,
+                    source=source,
+                    no_phone_only=no_phone,
+                    has_salary=has_salary,
+                    limit=limit,
+                    offset=offset,
+                    cursor=cursor,
+                    columns=columns,
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            if len(jobs) == limit:
+                next_cursor = encode_cursor(jobs[-1])
+
+        if projection is not None:
+            return _projected_body(jobs, projection, count=len(jobs), offset=offset, next_cursor=next_cursor)
+        return _jobs_body(jobs, count=len(jobs), offset=offset, next_cursor=next_cursor)
+
+    params = {
+        "category": category, "source": source, "no_phone": no_phone, "has_salary": has_salary,
+        "search": search, "limit": limit, "offset": offset, "cursor": cursor, "fields": projection,
     }
+    return _cached("jobs", params, db, build, accept_encoding)
+
+
+BATCH_MAX_IDS = 200
+
+
+def _decode_tags(job: dict) -> dict:
+    """Parse a job's JSON-encoded tags column in place."""
+    if job.get('tags') and isinstance(job['tags'], str):
+        try:
+            job['tags'] = json.loads(job['tags'])
+        except:
+            job['tags'] = []
+    return job
+
+
+def _validators(jobs: list[dict]) -> dict:
+    """
+    ETag and Last-Modified headers derived from the jobs' ids, updated_at
+    and active flag (expiry and reactivation also bump updated_at).
+    """
+    stamps = [f"{job['id']}:{job.get('updated_at') or ''}:{int(bool(job.get('is_active')))}" for job in jobs]
+    etag = '"' + hashlib.sha256("\n".join(stamps).encode()).hexdigest()[:16] + '"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    updated = [job['updated_at'] for job in jobs if job.get('updated_at')]
+    if updated:
+        try:
+            last_modified = datetime.fromisoformat(max(updated)).replace(tzinfo=timezone.utc)
+            headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+        except ValueError:
+            pass
+    return headers
+
+
+def _not_modified(headers: dict, if_none_match: Optional[str], if_modified_since: Optional[str]) -> bool:
+    """Evaluate conditional GET headers against _validators output (If-None-Match wins)."""
+    if if_none_match is not None:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in candidates or headers["ETag"] in candidates
+    if if_modified_since and "Last-Modified" in headers:
+        try:
+            return parsedate_to_datetime(headers["Last-Modified"]) <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+class BatchJobsRequest(BaseModel):
+    ids: list[str]
+
+
+@app.post("/api/jobs/batch")
+def get_jobs_batch(req: BatchJobsRequest, db: JobDatabase = Depends(get_db)):
+    """Get up to BATCH_MAX_IDS jobs by ID in one query. Unknown IDs are listed in 'missing'."""
+    if len(req.ids) > BATCH_MAX_IDS:
+        raise HTTPException(status_code=400, detail=f"At most {BATCH_MAX_IDS} ids per request")
+
+    jobs = db.get_jobs_by_ids(req.ids)
+    found = {job['id'] for job in jobs}
+    archived = job_archive.get_jobs(
+        [job_id for job_id in dict.fromkeys(req.ids) if job_id not in found], with_description=False
+    )
+    jobs.extend(archived)
+    found.update(job['id'] for job in archived)
+
+    return JSONResponse(
+        content={
+            "count": len(jobs),
+            "jobs": [_decode_tags(job) for job in jobs],
+            "missing": [job_id for job_id in dict.fromkeys(req.ids) if job_id not in found],
+        },
+        headers=_validators(jobs),
+    )
+
+
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", iter_ndjson),
+    "csv": ("text/csv; charset=utf-8", iter_csv),
+}
+
+
+@app.get("/api/jobs/export")
+def export_jobs(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    category: Optional[str] = None,
+    source: Optional[str] = None,
+    no_phone: bool = False,
+    has_salary: bool = False,
+    with_description: bool = Query(False, description="Include full descriptions"),
+    fields: Optional[str] = FIELDS_QUERY,
+):
+    """Stream every matching job as NDJSON or CSV, newest first."""
+    media_type, serializer = EXPORT_FORMATS[format]
+    columns = _parse_fields(fields) or LIST_COLUMNS
+    output_fields = columns + ('description',) if with_description else columns
+
+    jobs = db_pool.iter_jobs(
+        category=category,
+        source=source,
+        no_phone_only=no_phone,
+        has_salary=has_salary,
+        with_description=with_description,
+        columns=columns,
+    )
+
+    return StreamingResponse(
+        serializer(jobs, output_fields),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="jobs.{format}"'},
+    )
 
 
 @app.get("/api/jobs/{job_id}")
-def get_job(job_id: str, db: JobDatabase = Depends(get_db)):
-    """Get a single job by ID."""
-    jobs = db.get_jobs(limit=1000)
+def get_job(
+    job_id: str,
+    if_none_match: Optional[str] = Header(None),
+    if_modified_since: Optional[str] = Header(None),
+    db: JobDatabase = Depends(get_db),
+):
+    """Get a single job by ID, falling back to the archive. Supports conditional GET."""
+    job = db.get_job_by_id(job_id) or job_archive.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
 
-    for job in jobs:
-        if job['id'] == job_id:
-            if job.get('tags') and isinstance(job['tags'], str):
-                try:
-                    job['tags'] = json.loads(job['tags'])
-                except:
-                    job['tags'] = []
-            return job
+    headers = _validators([job])
+    if _not_modified(headers, if_none_match, if_modified_since):
+        return Response(status_code=304, headers=headers)
 
-    raise HTTPException(status_code=404, detail="Job not found")
+    return JSONResponse(content=_decode_tags(job), headers=headers)
 
 
 @app.get("/api/categories")
-def get_categories(db: JobDatabase = Depends(get_db)):
+def get_categories(db: JobDatabase = Depends(get_db), accept_encoding: Optional[str] = Header(None)):
     """Get list of job categories with counts."""
-    stats = db.get_stats()
-    return {
-        "categories": [
-            {"name": cat, "count": count}
-            for cat, count in stats['by_category'].items()
-        ]
-    }
+    def build():
+        stats = db.get_stats()
+        return {
+            "categories": [
+                {"name": cat, "count": count}
+                for cat, count in stats['by_category'].items()
+            ]
+        }
+
+    return _cached("categories", {}, db, build, accept_encoding)
 
 
 @app.get("/api/sources")
-def get_sources(db: JobDatabase = Depends(get_db)):
+def get_sources(db: JobDatabase = Depends(get_db), accept_encoding: Optional[str] = Header(None)):
     """Get list of job sources with counts and last scrape time."""
-    stats = db.get_stats()
-    return {
-        "sources": [
-            {
-                "name": source,
-                "count": stats['by_source'].get(source, 0),
-                "last_scrape": stats['last_scrape'].get(source),
-            }
-            for source in stats['by_source'].keys()
-        ]
-    }
+    def build():
+        stats = db.get_stats()
+        return {
+            "sources": [
+                {
+                    "name": source,
+                    "count": stats['by_source'].get(source, 0),
+                    "last_scrape": stats['last_scrape'].get(source),
+                }
+                for source in stats['by_source'].keys()
+            ]
+        }
+
+    return _cached("sources", {}, db, build, accept_encoding)
 
 
 @app.get("/api/stats")
-def get_stats(db: JobDatabase = Depends(get_db)):
+def get_stats(db: JobDatabase = Depends(get_db), accept_encoding: Optional[str] = Header(None)):
     """Get overall statistics."""
-    stats = db.get_stats()
-    return {
-        "total_jobs": stats['total_jobs'],
-        "no_phone_jobs": stats['no_phone_jobs'],
-        "jobs_with_salary": stats['with_salary'],
-        "by_source": stats['by_source'],
-        "by_category": stats['by_category'],
-        "last_scrape": stats['last_scrape'],
-    }
+    def build():
+        stats = db.get_stats()
+        return {
+            "total_jobs": stats['total_jobs'],
+            "no_phone_jobs": stats['no_phone_jobs'],
+            "jobs_with_salary": stats['with_salary'],
+            "by_source": stats['by_source'],
+            "by_category": stats['by_category'],
+            "last_scrape": stats['last_scrape'],
+        }
+
+    return _cached("stats", {}, db, build, accept_encoding)
 
 
 @app.get("/api/lazy-girl-jobs")
 def get_lazy_girl_jobs(
     limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    fields: Optional[str] = FIELDS_QUERY,
     db: JobDatabase = Depends(get_db),
+    accept_encoding: Optional[str] = Header(None),
 ):
-    """Get 'Lazy Girl Jobs' - remote jobs that don't require phone calls."""
-    lazy_categories = ['support', 'data-entry', 'moderation', 'va', 'writing']
-
-    all_jobs = []
-    seen_ids = set()
+    """Get 'Lazy Girl Jobs' - no-phone jobs, lazy categories and listed salaries first."""
+    projection = _parse_fields(fields)
+    columns = PAYLOAD_SELECT if projection is None else tuple(dict.fromkeys(projection + ('scraped_at',)))
 
-    for category in lazy_categories:
-        jobs = db.get_jobs(
-            category=category,
-            no_phone_only=True,
-            limit=limit,
-        )
-        for job in jobs:
-            if job['id'] not in seen_ids:
-                all_jobs.append(job)
-                seen_ids.add(job['id'])
-
-    other_jobs = db.get_jobs(no_phone_only=True, limit=limit)
-    for job in other_jobs:
-        if job['id'] not in seen_ids:
-            all_jobs.append(job)
-            seen_ids.add(job['id'])
-
-    all_jobs.sort(key=lambda x: x.get('scraped_at', ''), reverse=True)
+    def build():
+        try:
+            jobs = db.get_lazy_jobs(limit=limit, offset=offset, cursor=cursor, columns=columns)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        next_cursor = encode_cursor(jobs[-1], LAZY_FEED_KEYS) if len(jobs) == limit else None
 
-    for job in all_jobs[:limit]:
-        if job.get('tags') and isinstance(job['tags'], str):
-            try:
-                job['tags'] = json.loads(job['tags'])
-            except:
-                job['tags'] = []
+        if projection is not None:
+            return _projected_body(jobs, projection, count=len(jobs), offset=offset, next_cursor=next_cursor)
+        return _jobs_body(jobs, count=len(jobs), offset=offset, next_cursor=next_cursor)
 
-    return {
-        "count": len(all_jobs[:limit]),
-        "jobs": all_jobs[:limit],
-    }
+    params = {"limit": limit, "offset": offset, "cursor": cursor, "fields": projection}
+    return _cached("lazy-girl-jobs", params, db, build, accept_encoding)
 
 
 # --- User Endpoints (public: register, verify) ---
@@ -254,37 +465,72 @@ class DowngradeRequest(BaseModel):
     stripe_customer_id: str
 
 
+# bcrypt runs in its own process pool; the handlers below only await it,
+# so a burst of sign-ins cannot tie up the threadpool serving job listings
+password_hasher = PasswordHasher(
+    workers=int(os.environ.get("HASH_WORKERS", "2")),
+    max_queue=int(os.environ.get("HASH_QUEUE", "16")),
+)
+
+
+@app.on_event("shutdown")
+def stop_password_hasher():
+    password_hasher.shutdown()
+
+
+async def _run_hasher(operation):
+    """Await a password_hasher call, mapping saturation to 429 and failure to 503."""
+    try:
+        return await operation
+    except HasherSaturated:
+        raise HTTPException(status_code=429, detail="Too many sign-in attempts, retry shortly",
+                            headers={"Retry-After": "1"})
+    except HasherUnavailable:
+        raise HTTPException(status_code=503, detail="Authentication temporarily unavailable",
+                            headers={"Retry-After": "5"})
+
+
+def _find_user(email: str) -> Optional[dict]:
+    with db_pool.reader() as db:
+        row = db.conn.execute("SELECT * FROM users WHERE email = ?", (email,)).fetchone()
+    return dict(row) if row else None
+
+
+def _insert_user(user_id: str, req: RegisterRequest, password_hash: str):
+    with db_pool.writer() as writer:
+        try:
+            writer.conn.execute(
+                "INSERT INTO users (id, email, password_hash, name) VALUES (?, ?, ?, ?)",
+                (user_id, req.email, password_hash, req.name)
+            )
+            writer.conn.commit()
+        except sqlite3.IntegrityError:
+            raise HTTPException(status_code=400, detail="User already exists")
+
+
 @app.post("/api/users/register")
-def register_user(req: RegisterRequest, db: JobDatabase = Depends(get_db)):
+async def register_user(req: RegisterRequest):
     """Register a new user."""
-    cursor = db.conn.cursor()
-    cursor.execute("SELECT id FROM users WHERE email = ?", (req.email,))
-    if cursor.fetchone():
+    # Pooled connections are borrowed only around queries, never across the hash
+    if await run_in_threadpool(_find_user, req.email):
         raise HTTPException(status_code=400, detail="User already exists")
 
     user_id = str(uuid.uuid4())
-    password_hash = bcrypt.hashpw(req.password.encode(), bcrypt.gensalt(12)).decode()
+    password_hash = await _run_hasher(password_hasher.hash(req.password))
 
-    cursor.execute(
-        "INSERT INTO users (id, email, password_hash, name) VALUES (?, ?, ?, ?)",
-        (user_id, req.email, password_hash, req.name)
-    )
-    db.conn.commit()
+    # Hash before taking the writer so other writes aren't held up by bcrypt
+    await run_in_threadpool(_insert_user, user_id, req, password_hash)
     return {"id": user_id, "email": req.email, "name": req.name, "isPro": False}
 
 
 @app.post("/api/users/verify")
-def verify_user(req: VerifyRequest, db: JobDatabase = Depends(get_db)):
+async def verify_user(req: VerifyRequest):
     """Verify user credentials. Returns user info if valid."""
-    cursor = db.conn.cursor()
-    cursor.execute("SELECT * FROM users WHERE email = ?", (req.email,))
-    row = cursor.fetchone()
-
-    if not row:
+    user = await run_in_threadpool(_find_user, req.email)
+    if not user:
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
-    user = dict(row)
-    if not bcrypt.checkpw(req.password.encode(), user["password_hash"].encode()):
+    if not await _run_hasher(password_hasher.check(req.email, req.password, user["password_hash"])):
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
     return {
@@ -298,7 +544,7 @@ def verify_user(req: VerifyRequest, db: JobDatabase = Depends(get_db)):
 # --- Protected Endpoints (server-to-server only, require INTERNAL_TOKEN) ---
 
 @app.post("/api/users/upgrade")
-def upgrade_user(req: UpgradeRequest, authorization: str = Header(None), db: JobDatabase = Depends(get_db)):
+def upgrade_user(req: UpgradeRequest, authorization: str = Header(None), db: JobDatabase = Depends(get_writer_db)):
     """Upgrade a user to Pro. Requires internal token."""
     verify_internal_token(authorization)
     cursor = db.conn.cursor()
@@ -311,7 +557,7 @@ def upgrade_user(req: UpgradeRequest, authorization: str = Header(None), db: Job
 
 
 @app.post("/api/users/downgrade")
-def downgrade_user(req: DowngradeRequest, authorization: str = Header(None), db: JobDatabase = Depends(get_db)):
+def downgrade_user(req: DowngradeRequest, authorization: str = Header(None), db: JobDatabase = Depends(get_writer_db)):
     """Downgrade a user. Requires internal token."""
     verify_internal_token(authorization)
     cursor = db.conn.cursor()
@@ -325,45 +571,111 @@ def downgrade_user(req: DowngradeRequest, authorization: str = Header(None), db:
 
 # --- Scraper Endpoint ---
 
-async def _run_scrape(sources_to_scrape: list[str]):
-    """Run scraping in background."""
-    from src.scrapers import RemoteOKScraper, WeWorkRemotelyScraper, RedditScraper, JobSpyScraper, WellfoundScraper
+SCRAPE_SOURCES = ['remoteok', 'weworkremotely', 'reddit', 'jobspy', 'wellfound']
+
+# Pages are recorded here by the API process, only after their jobs are saved;
+# scrape workers open the same file to revalidate against it
+http_cache = HttpCache()
 
-    SCRAPERS = {
-        'remoteok': RemoteOKScraper,
-        'weworkremotely': WeWorkRemotelyScraper,
-        'reddit': RedditScraper,
-        'jobspy': JobSpyScraper,
-        'wellfound': WellfoundScraper,
-    }
 
-    db = JobDatabase(DB_PATH)
+def _log_scrape_start(source_name: str) -> int:
+    with db_pool.writer() as db:
+        return db.log_scrape(source_name)
 
-    for source_name in sources_to_scrape:
-        scraper = SCRAPERS[source_name]()
-        log_id = db.log_scrape(source_name)
 
+def _log_scrape_end(log_id: int, status: str, error: Optional[str] = None, stats: Optional[StreamStats] = None):
+    """Close a scrape that did not finish, recording whatever it streamed in before stopping."""
+    stats = stats or StreamStats()
+    with db_pool.writer() as db:
+        db.finish_scrape(log_id, stats.found, stats.new, stats.updated, status=status, error=error)
+
+
+def _write_jobs(jobs: list[dict]) -> tuple[int, int]:
+    """Upsert one streamed batch through the single writer."""
+    with db_pool.writer() as db:
+        return write_jobs(db, jobs)
+
+
+def _finish_source(
+    source_name: str, log_id: int, stats: StreamStats, page_log: PageLog, run_started: datetime
+) -> tuple[int, int]:
+    with db_pool.writer() as db:
+        return finish_source(
+            db, source_name, log_id, stats, page_log, run_started, http_cache=http_cache
+        )
+
+
+async def _scrape_source(source_name: str, source_run: SourceRun):
+    """
+    Scrape one source in a worker process, streaming its pages into the
+    database as they arrive and reporting progress on source_run. Database
+    work runs in the threadpool, so the event loop only relays messages
+    while a scrape is in progress.
+    """
+    log_id = await run_in_threadpool(_log_scrape_start, source_name)
+    run_started = datetime.utcnow()
+    stats = StreamStats()
+    page_log = PageLog()
+    timeout = SCRAPERS[source_name].timeout
+
+    async def write_batch(jobs: list[dict]) -> tuple[int, int]:
+        new_count, updated_count = await run_in_threadpool(_write_jobs, jobs)
+        source_run.progress.rows_written += new_count + updated_count
+        return new_count, updated_count
+
+    try:
         try:
-            jobs = await scraper.scrape()
-            new_count = 0
-            updated_count = 0
+            await asyncio.wait_for(
+                write_stream(stream_in_worker(source_name, source_run.progress, page_log), write_batch, stats),
+                timeout,
+            )
+        except asyncio.TimeoutError:
+            raise RuntimeError(f"Scrape of {source_name} timed out after {timeout:g}s") from None
+        found, expired_count = await run_in_threadpool(
+            _finish_source, source_name, log_id, stats, page_log, run_started
+        )
+        print(
+            f"[scrape] {source_name}: found={found}, new={stats.new}, updated={stats.updated}, "
+            f"expired={expired_count}, unchanged_pages={len(page_log.unchanged)}"
+        )
+
+    except asyncio.CancelledError:
+        await run_in_threadpool(_log_scrape_end, log_id, 'cancelled', None, stats)
+        print(f"[scrape] {source_name}: cancelled")
+        raise
+
+    except Exception as e:
+        await run_in_threadpool(_log_scrape_end, log_id, 'error', str(e), stats)
+        print(f"[scrape] {source_name}: error={e}")
+        raise
+
+
+def _purge_inactive() -> int:
+    with db_pool.writer() as db:
+        return db.purge_inactive_jobs()
+
 
-            for job in jobs:
-                is_new, is_updated = db.upsert_job(job.to_dict())
-                if is_new:
-                    new_count += 1
-                elif is_updated:
-                    updated_count += 1
+async def _purge_after_run(run: ScrapeRun):
+    purged = await run_in_threadpool(_purge_inactive)
+    print(f"[scrape] Run {run.id} completed, purged={purged}")
 
-            db.finish_scrape(log_id, jobs_found=len(jobs), jobs_new=new_count, jobs_updated=updated_count)
-            print(f"[scrape] {source_name}: found={len(jobs)}, new={new_count}, updated={updated_count}")
 
-        except Exception as e:
-            db.finish_scrape(log_id, 0, 0, 0, status='error', error=str(e))
-            print(f"[scrape] {source_name}: error={e}")
+scrape_manager = ScrapeManager(
+    _scrape_source,
+    max_concurrent=int(os.environ.get("SCRAPE_CONCURRENCY", str(len(SCRAPE_SOURCES)))),
+    after_run=_purge_after_run,
+)
+
+
+@app.on_event("shutdown")
+async def stop_scrapes():
+    await scrape_manager.shutdown()
+    http_cache.close()
+
 
-    db.close()
-    print("[scrape] All sources completed")
+def _check_scrape_token(token: str):
+    if token != SCRAPE_TOKEN:
+        raise HTTPException(status_code=403, detail="Invalid token")
 
 
 @app.api_route("/api/scrape", methods=["GET", "POST"])
@@ -372,36 +684,64 @@ async def trigger_scrape(
     source: Optional[str] = Query(None, description="Specific source to scrape"),
 ):
     """Trigger a scrape run in background. Protected by secret token."""
-    if token != SCRAPE_TOKEN:
-        raise HTTPException(status_code=403, detail="Invalid token")
+    _check_scrape_token(token)
 
-    available = ['remoteok', 'weworkremotely', 'reddit', 'jobspy', 'wellfound']
+    if source and source not in SCRAPE_SOURCES:
+        raise HTTPException(status_code=400, detail=f"Unknown source: {source}. Available: {SCRAPE_SOURCES}")
 
-    if source and source not in available:
-        raise HTTPException(status_code=400, detail=f"Unknown source: {source}. Available: {available}")
+    sources_to_scrape = [source] if source else SCRAPE_SOURCES
 
-    sources_to_scrape = [source] if source else available
-
-    asyncio.create_task(_run_scrape(sources_to_scrape))
+    run, coalesced = scrape_manager.submit(sources_to_scrape)
+    if run is None:
+        message = f"Already scraping: {sorted(coalesced)}"
+    else:
+        message = f"Scraping started for: {list(run.sources)}"
 
     return JSONResponse(
         status_code=202,
-        content={"status": "accepted", "message": f"Scraping started for: {sources_to_scrape}"}
+        content={
+            "status": "accepted",
+            "message": message,
+            "run_id": run.id if run else None,
+            "coalesced": coalesced,
+        }
     )
 
 
+@app.post("/api/scrape/{run_id}/cancel")
+async def cancel_scrape(run_id: str, token: str = Query(..., description="Secret token to authorize scraping")):
+    """Cancel a queued or running scrape run. Protected by secret token."""
+    _check_scrape_token(token)
+    run = scrape_manager.cancel(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="Scrape run not found")
+    return {"id": run.id, "status": run.status if not run.active else "cancelling"}
+
+
+@app.get("/api/cache/stats")
+def get_cache_stats():
+    """Response cache hit/miss/eviction counters."""
+    return response_cache.stats()
+
+
+@app.get("/api/auth/stats")
+def get_auth_stats():
+    """Password-hashing pool throughput, queue and latency counters."""
+    return password_hasher.stats()
+
+
 @app.get("/api/scrape/status")
 def get_scrape_status(db: JobDatabase = Depends(get_db)):
-    """Check last scrape results from the scrape_log table."""
+    """Live progress of API-started runs plus the last results from the scrape_log table."""
     cursor = db.conn.cursor()
     cursor.execute("""
-        SELECT source, started_at, finished_at, jobs_found, jobs_new, jobs_updated, status, error
+        SELECT source, started_at, finished_at, jobs_found, jobs_new, jobs_updated, jobs_expired, status, error
         FROM scrape_log
         ORDER BY started_at DESC
         LIMIT 10
     """)
     rows = cursor.fetchall()
-    return {"recent_scrapes": [dict(row) for row in rows]}
+    return {"runs": scrape_manager.runs(), "recent_scrapes": [dict(row) for row in rows]}
 
 
 if __name__ == "__main__":
@@ -0,0 +1,129 @@
+"""Cold SQLite archive for expired job rows."""
+
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from src.database import compress_text, connect, decompress_text
+
+
+# Columns copied from jobs into the archive, in insert order
+ARCHIVE_COLUMNS = (
+    'id', 'source', 'source_id', 'title', 'company', 'company_logo',
+    'description', 'location', 'salary_min', 'salary_max', 'salary_currency',
+    'url', 'apply_url', 'tags', 'category', 'is_no_phone', 'posted_at',
+    'scraped_at', 'updated_at', 'last_seen_at', 'content_hash',
+)
+
+
+class JobArchive:
+    """
+    Separate SQLite file holding jobs moved out of the hot database.
+
+    Descriptions are stored zlib-compressed; everything else is kept as-is
+    so archived rows can be served in the same shape as live ones.
+    """
+
+    def __init__(self, db_path: str = "data/jobs_archive.db", read_only: bool = False):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn: Optional[sqlite3.Connection] = connect(self.db_path)
+        self._init_db()
+        if read_only:
+            self.conn.execute("PRAGMA query_only = ON")
+
+    def _init_db(self):
+        """Initialize archive schema."""
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS archived_jobs (
+                id TEXT PRIMARY KEY,
+                source TEXT NOT NULL,
+                source_id TEXT,
+                title TEXT NOT NULL,
+                company TEXT,
+                company_logo TEXT,
+                description BLOB,
+                location TEXT,
+                salary_min INTEGER,
+                salary_max INTEGER,
+                salary_currency TEXT,
+                url TEXT NOT NULL,
+                apply_url TEXT,
+                tags TEXT,
+                category TEXT,
+                is_no_phone BOOLEAN DEFAULT 0,
+                posted_at TEXT,
+                scraped_at TEXT,
+                updated_at TEXT,
+                last_seen_at TEXT,
+                content_hash TEXT,
+                archived_at TEXT NOT NULL
+            );
+        """)
+        self.conn.commit()
+
+    def add_jobs(self, jobs: list[dict]) -> int:
+        """Store job rows (as read from the jobs table) in one transaction. Returns rows written."""
+        archived_at = datetime.utcnow().isoformat()
+        rows = []
+        for job in jobs:
+            values = [job.get(column) for column in ARCHIVE_COLUMNS]
+            description = job.get('description')
+            values[ARCHIVE_COLUMNS.index('description')] = (
+                compress_text(description) if description else None
+            )
+            rows.append((*values, archived_at))
+
+        placeholders = ", ".join("?" * (len(ARCHIVE_COLUMNS) + 1))
+        with self.conn:
+            # Replace so a chunk interrupted before its hot-side delete can be re-archived
+            self.conn.executemany(f"""
+                INSERT OR REPLACE INTO archived_jobs ({", ".join(ARCHIVE_COLUMNS)}, archived_at)
+                VALUES ({placeholders})
+            """, rows)
+        return len(rows)
+
+    def remove_jobs(self, ids: list[str]) -> int:
+        """Drop archived rows, e.g. for jobs that came back to life before leaving the hot database."""
+        with self.conn:
+            cursor = self.conn.execute(
+                f"DELETE FROM archived_jobs WHERE id IN ({','.join('?' * len(ids))})", ids
+            )
+        return cursor.rowcount
+
+    def get_job(self, job_id: str, with_description: bool = True) -> Optional[dict]:
+        """Look up an archived job by id, with its description decompressed."""
+        row = self.conn.execute(
+            "SELECT * FROM archived_jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+        return self._job(row, with_description) if row is not None else None
+
+    def get_jobs(self, ids: list[str], with_description: bool = True) -> list[dict]:
+        """Look up archived jobs by id in one query, in the order given; unknown ids are skipped."""
+        if not ids:
+            return []
+        rows = self.conn.execute(
+            f"SELECT * FROM archived_jobs WHERE id IN ({','.join('?' * len(ids))})", ids
+        ).fetchall()
+        by_id = {row['id']: self._job(row, with_description) for row in rows}
+        return [by_id[job_id] for job_id in dict.fromkeys(ids) if job_id in by_id]
+
+    @staticmethod
+    def _job(row: sqlite3.Row, with_description: bool) -> dict:
+        job = dict(row)
+        if with_description:
+            job['description'] = decompress_text(job['description'])
+        else:
+            del job['description']
+        job['is_active'] = 0
+        return job
+
+    def count(self) -> int:
+        """Number of archived jobs."""
+        return self.conn.execute("SELECT COUNT(*) FROM archived_jobs").fetchone()[0]
+
+    def close(self):
+        """Close database connection."""
+        if self.conn:
+            self.conn.close()
@@ -0,0 +1,90 @@
+"""In-process LRU + TTL cache for API responses."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache whose entries also expire after `ttl` seconds.
+
+    Every entry is tied to a data version (see JobDatabase.get_data_version).
+    The first lookup that sees a newer version drops everything cached for
+    older ones, so a finished scrape is never followed by stale responses.
+    """
+
+    def __init__(self, max_entries: int = 512, ttl: float = 300.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._version: int | None = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(endpoint: str, params: dict) -> tuple:
+        """Normalize query parameters into a hashable key (unset values ignored, order-independent)."""
+        return (endpoint, tuple(sorted(
+            (name, value) for name, value in params.items() if value is not None
+        )))
+
+    def get_or_compute(self, key: Hashable, version: int, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for key at this data version, computing and storing it on a miss."""
+        now = time.monotonic()
+        with self._lock:
+            if version != self._version:
+                if self._version is not None:
+                    self.invalidations += len(self._entries)
+                self._entries.clear()
+                self._version = version
+
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+
+        # Computed outside the lock; concurrent misses on one key may both compute
+        value = compute()
+
+        with self._lock:
+            if version == self._version:
+                self._entries[key] = (now + self.ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return value
+
+    def stats(self) -> dict:
+        """Counters for monitoring."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                "data_version": self._version,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+    def clear(self):
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
@@ -1,25 +1,324 @@
 """SQLite database operations for job storage."""
 
+import base64
+import hashlib
+import queue
+import re
 import sqlite3
+import threading
+import zlib
+from contextlib import contextmanager, nullcontext
+from itertools import islice
 from pathlib import Path
-from typing import Optional
-from datetime import datetime
+from typing import TYPE_CHECKING, Callable, ContextManager, Iterable, Iterator, Optional
+from datetime import datetime, timedelta
 import json
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from src.archive import JobArchive
+
+
+# Per-connection page cache (negative = KiB) and memory-mapped I/O window
+CACHE_SIZE_KIB = 64 * 1024
+MMAP_SIZE = 256 * 1024 * 1024
+
+# Rows per statement batch in bulk_upsert_jobs (well under SQLite's bound-variable limit)
+BULK_CHUNK_SIZE = 500
+
+# PRAGMA user_version of the current schema; see _init_db for the data
+# migrations each step performs
+SCHEMA_VERSION = 6
+
+# Columns added after the original schema, applied to older databases on open
+COLUMN_MIGRATIONS = {
+    'jobs': {
+        'content_hash': "TEXT",
+        'last_seen_at': "TEXT",
+        'snippet': "TEXT",
+        'lazy_score': "INTEGER",
+    },
+    'scrape_log': {
+        'jobs_expired': "INTEGER DEFAULT 0",
+    },
+}
+
+# Days a listing may go unseen by its source's scrapes before it is deactivated
+EXPIRY_GRACE_DAYS = 3.0
+
+# Days an inactive listing is kept before it is purged
+RETENTION_DAYS = 90.0
+
+# Rows moved per transaction by archive_jobs, keeping each write lock short
+ARCHIVE_CHUNK_SIZE = 500
+
+# Rows fetched per keyset page by iter_jobs_keyset; bounds export memory
+EXPORT_CHUNK_SIZE = 500
+
+# Characters of description kept inline on jobs for list views
+SNIPPET_LENGTH = 200
+
+ZLIB_LEVEL = 6
+
+# Columns returned by list queries; the full description lives in job_descriptions
+LIST_COLUMNS = (
+    'id', 'source', 'source_id', 'title', 'company', 'company_logo', 'snippet',
+    'location', 'salary_min', 'salary_max', 'salary_currency', 'url', 'apply_url',
+    'tags', 'category', 'is_no_phone', 'posted_at', 'scraped_at', 'updated_at',
+    'is_active',
+)
+
+# Columns that may be selected from jobs by name; list query column
+# arguments are checked against this before being interpolated into SQL
+SELECTABLE_COLUMNS = frozenset(LIST_COLUMNS) | {'api_json', 'lazy_score'}
+
+# Selectable columns that live in side tables keyed by job id, so the rows
+# that filters and index scans walk stay narrow
+SIDE_COLUMNS = {
+    'api_json': "(SELECT body FROM job_payloads WHERE job_id = {table}id)",
+}
+
+# Columns serialized into job_payloads (selected as api_json); is_active stays
+# a plain column, read by the list filters, and is appended when served
+PAYLOAD_COLUMNS = tuple(column for column in LIST_COLUMNS if column != 'is_active')
+
+# Columns list endpoints read to serve stored payloads and build cursors
+PAYLOAD_SELECT = ('id', 'scraped_at', 'is_active', 'api_json')
+
+# Categories that rank first in the lazy-girl feed
+LAZY_CATEGORIES = ('support', 'data-entry', 'moderation', 'va', 'writing')
+
+# Sort keys of the lazy-girl feed, highest first; also its cursor layout
+LAZY_FEED_KEYS = ('lazy_score', 'scraped_at', 'id')
+
+# Job fields that make up a listing's content fingerprint; timestamps and
+# identity fields are excluded so a re-scrape of the same posting matches
+FINGERPRINT_FIELDS = (
+    'title', 'company', 'company_logo', 'description', 'location',
+    'salary_min', 'salary_max', 'salary_currency', 'url', 'apply_url',
+    'tags', 'category', 'is_no_phone',
+)
+
+# bm25 column weights for jobs_fts: title, company, description, tags
+SEARCH_WEIGHTS = (10.0, 5.0, 1.0, 3.0)
+
+# Age in days at which a search hit's relevance score is halved
+SEARCH_RECENCY_DAYS = 30.0
+
+# Shortest last search word that is prefix-matched (jobs_fts indexes 2 and 3 character prefixes)
+SEARCH_PREFIX_MIN = 2
+
+# Most recently inserted active matches scored per search; keeps search cost bounded
+# by this pool rather than by the number of matching rows
+SEARCH_CANDIDATES = 1000
+
+
+def fingerprint(job_data: dict) -> str:
+    """Hash the content fields of a Job.to_dict() payload."""
+    payload = {name: job_data.get(name) for name in FINGERPRINT_FIELDS}
+    payload['is_no_phone'] = bool(payload['is_no_phone'])
+    content = json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(content.encode()).hexdigest()[:16]
+
+
+def parse_fields(fields: Optional[str]) -> Optional[tuple[str, ...]]:
+    """
+    Parse a comma-separated ?fields= value into LIST_COLUMNS order, always
+    including id. Returns None (all fields) when empty. Raises ValueError
+    on names outside LIST_COLUMNS.
+    """
+    names = {name.strip() for name in (fields or "").split(",") if name.strip()}
+    if not names:
+        return None
+    unknown = names - set(LIST_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    names.add('id')
+    return tuple(column for column in LIST_COLUMNS if column in names)
+
+
+def select_list(columns: Iterable[str], table: str = "") -> str:
+    """Comma-separated SELECT list for columns. Raises ValueError on names outside SELECTABLE_COLUMNS."""
+    columns = list(columns)
+    unknown = set(columns) - SELECTABLE_COLUMNS
+    if unknown:
+        raise ValueError(f"Unknown columns: {', '.join(sorted(unknown))}")
+    prefix = f"{table}." if table else ""
+    return ", ".join(
+        f"{SIDE_COLUMNS[column].format(table=prefix)} AS {column}" if column in SIDE_COLUMNS else prefix + column
+        for column in columns
+    )
+
+
+def lazy_score(job_data: dict) -> Optional[int]:
+    """
+    Rank a job for the lazy-girl feed: None unless it needs no phone, then
+    1, plus 2 for a lazy category and 1 for a listed salary.
+    Only depends on fingerprinted fields, so it is refreshed whenever they change.
+    """
+    if not job_data.get('is_no_phone'):
+        return None
+    score = 1
+    if job_data.get('category') in LAZY_CATEGORIES:
+        score += 2
+    if job_data.get('salary_min') is not None:
+        score += 1
+    return score
+
+
+def dumps_json(obj) -> bytes:
+    """Compact UTF-8 JSON, via orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode()
+
+
+def job_payload(row: dict) -> bytes:
+    """Serialize a job row's PAYLOAD_COLUMNS as its API JSON object, tags decoded."""
+    job = {column: row[column] for column in PAYLOAD_COLUMNS}
+    if job['tags']:
+        try:
+            job['tags'] = json.loads(job['tags'])
+        except ValueError:
+            job['tags'] = []
+    return dumps_json(job)
+
+
+def compress_text(text: str) -> bytes:
+    """zlib-compress a description for storage."""
+    return zlib.compress(text.encode(), ZLIB_LEVEL)
+
+
+def decompress_text(blob: Optional[bytes]) -> Optional[str]:
+    """Inverse of compress_text; passes None through."""
+    return zlib.decompress(blob).decode() if blob is not None else None
+
+
+def make_snippet(text: Optional[str], length: int = SNIPPET_LENGTH) -> Optional[str]:
+    """Whitespace-collapsed preview of a description, cut at a word boundary."""
+    if not text:
+        return None
+    text = " ".join(text.split())
+    if len(text) <= length:
+        return text
+    return text[:length].rsplit(" ", 1)[0] + "…"
+
+
+def encode_cursor(job: dict, keys: tuple[str, ...] = ('scraped_at', 'id')) -> str:
+    """Build an opaque pagination cursor pointing just past this job in a listing sorted by keys."""
+    raw = json.dumps([job[key] for key in keys], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, types: tuple[type, ...] = (str, str)) -> tuple:
+    """Parse a cursor from encode_cursor into its key values. Raises ValueError if malformed."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    if (
+        not isinstance(values, list)
+        or len(values) != len(types)
+        or not all(isinstance(value, kind) for value, kind in zip(values, types))
+    ):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return tuple(values)
+
+
+def connect(db_path: str | Path, read_only: bool = False) -> sqlite3.Connection:
+    """Open a SQLite connection in WAL mode with a tuned cache and mmap window."""
+    conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30.0)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute(f"PRAGMA cache_size = -{CACHE_SIZE_KIB}")
+    conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+    # The search index delete trigger replays descriptions through this
+    conn.create_function("decompress_text", 1, decompress_text, deterministic=True)
+    if read_only:
+        conn.execute("PRAGMA query_only = ON")
+    return conn
+
+
+def iter_jobs_keyset(
+    borrow: Callable[[], ContextManager["JobDatabase"]],
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+    columns: tuple[str, ...] = LIST_COLUMNS,
+    **filters
+) -> Iterator[dict]:
+    """
+    Yield every job get_jobs(**filters) matches, newest first, one keyset
+    page on (scraped_at, id) at a time. borrow() provides the database for
+    each page and is released before the page is yielded, so memory stays
+    flat and no connection or read snapshot is held while a slow consumer
+    works through the rows.
+    """
+    query_columns = tuple(dict.fromkeys(columns + ('scraped_at', 'id')))
+    extra = [column for column in query_columns if column not in columns]
+    cursor = None
+    while True:
+        with borrow() as db:
+            jobs = db.get_jobs(limit=chunk_size, cursor=cursor, columns=query_columns, **filters)
+        if not jobs:
+            return
+        cursor = encode_cursor(jobs[-1])
+        for job in jobs:
+            for column in extra:
+                del job[column]
+            yield job
+        if len(jobs) < chunk_size:
+            return
+
 
 class JobDatabase:
     """SQLite database for storing scraped jobs."""
     
-    def __init__(self, db_path: str = "data/jobs.db"):
+    def __init__(self, db_path: str = "data/jobs.db", conn: Optional[sqlite3.Connection] = None):
+        """
+        Open the database at db_path and bootstrap its schema, or wrap an
+        existing connection (e.g. from ConnectionPool) whose schema is
+        already in place.
+        """
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.conn: Optional[sqlite3.Connection] = None
-        self._init_db()
+        self.conn: Optional[sqlite3.Connection] = conn
+        if conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = connect(self.db_path)
+            self._init_db()
     
     def _init_db(self):
         """Initialize database schema."""
-        self.conn = sqlite3.connect(self.db_path)
-        self.conn.row_factory = sqlite3.Row
+        existing_tables = {
+            row['name'] for row in self.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )
+        }
+        self._migrate_columns(existing_tables)
+        
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        upgrading = 'jobs' in existing_tables and version < SCHEMA_VERSION
+        if upgrading and version < 5:
+            # v1 moved descriptions out of jobs, so the search index can no
+            # longer be an external-content table fed by triggers on jobs;
+            # v4 added prefix indexes to it and v5 made it contentless. Each
+            # time it is rebuilt below
+            self.conn.executescript("""
+                DROP TRIGGER IF EXISTS jobs_fts_insert;
+                DROP TRIGGER IF EXISTS jobs_fts_update;
+                DROP TRIGGER IF EXISTS jobs_fts_delete;
+                DROP TRIGGER IF EXISTS jobs_delete_dependents;
+                DROP TABLE IF EXISTS jobs_fts;
+            """)
+            existing_tables.discard('jobs_fts')
+        if upgrading and version < 6:
+            # v6 made the delete trigger clean up job_payloads too
+            self.conn.execute("DROP TRIGGER IF EXISTS jobs_delete_dependents")
         
         self.conn.executescript("""
             CREATE TABLE IF NOT EXISTS users (
@@ -53,7 +352,11 @@ class JobDatabase:
                 posted_at TEXT,
                 scraped_at TEXT DEFAULT CURRENT_TIMESTAMP,
                 updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                is_active BOOLEAN DEFAULT 1
+                is_active BOOLEAN DEFAULT 1,
+                content_hash TEXT,
+                last_seen_at TEXT,
+                snippet TEXT,
+                lazy_score INTEGER
             );
             
             CREATE INDEX IF NOT EXISTS idx_jobs_category ON jobs(category);
@@ -61,6 +364,10 @@ class JobDatabase:
             CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs(source);
             CREATE INDEX IF NOT EXISTS idx_jobs_no_phone ON jobs(is_no_phone);
             CREATE INDEX IF NOT EXISTS idx_jobs_active ON jobs(is_active);
+            CREATE INDEX IF NOT EXISTS idx_jobs_active_scraped ON jobs(is_active, scraped_at, id);
+            CREATE INDEX IF NOT EXISTS idx_jobs_source_seen ON jobs(source, last_seen_at);
+            CREATE INDEX IF NOT EXISTS idx_jobs_lazy_feed ON jobs(is_active, lazy_score, scraped_at, id)
+                WHERE lazy_score IS NOT NULL;
             
             CREATE TABLE IF NOT EXISTS scrape_log (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -71,96 +378,555 @@ class JobDatabase:
                 jobs_new INTEGER DEFAULT 0,
                 jobs_updated INTEGER DEFAULT 0,
                 status TEXT DEFAULT 'running',
-                error TEXT
+                error TEXT,
+                jobs_expired INTEGER DEFAULT 0
+            );
+            
+            -- Full descriptions, zlib-compressed; read only by detail views and export
+            CREATE TABLE IF NOT EXISTS job_descriptions (
+                job_id TEXT PRIMARY KEY,
+                body BLOB NOT NULL
+            );
+            
+            -- Each job's list JSON (see job_payload), spliced into list responses
+            CREATE TABLE IF NOT EXISTS job_payloads (
+                job_id TEXT PRIMARY KEY,
+                body BLOB NOT NULL
+            );
+            
+            -- Full-text index over jobs (rowid = jobs.rowid). Rows are written by
+            -- bulk_upsert_jobs, which holds the uncompressed description. It is
+            -- contentless, so descriptions are only stored compressed; removing a
+            -- row means replaying the exact values it was indexed with
+            CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+                title, company, description, tags,
+                tokenize='porter unicode61',
+                prefix='2 3',
+                content=''
+            );
+            
+            CREATE TRIGGER IF NOT EXISTS jobs_delete_dependents AFTER DELETE ON jobs BEGIN
+                INSERT INTO jobs_fts (jobs_fts, rowid, title, company, description, tags)
+                SELECT 'delete', old.rowid, old.title, old.company, decompress_text(
+                    (SELECT body FROM job_descriptions WHERE job_id = old.id)
+                ), old.tags;
+                DELETE FROM job_descriptions WHERE job_id = old.id;
+                DELETE FROM job_payloads WHERE job_id = old.id;
+            END;
+            
+            -- Active-job counters per (dimension, key) backing get_stats:
+            -- source/<name>, category/<name or ''>, no_phone/<0|1>, salary/<0|1>
+            CREATE TABLE IF NOT EXISTS job_counts (
+                dimension TEXT NOT NULL,
+                key TEXT NOT NULL,
+                count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (dimension, key)
+            );
+            
+            -- Bumped by finish_scrape; lets caches detect new data across processes
+            CREATE TABLE IF NOT EXISTS data_version (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                version INTEGER NOT NULL DEFAULT 0
             );
+            INSERT OR IGNORE INTO data_version (id, version) VALUES (1, 0);
+            
+            CREATE TABLE IF NOT EXISTS last_scrapes (
+                source TEXT PRIMARY KEY,
+                scraped_at TEXT
+            );
+            
+            CREATE TRIGGER IF NOT EXISTS job_counts_insert AFTER INSERT ON jobs BEGIN
+                INSERT INTO job_counts (dimension, key, count)
+                SELECT dimension, key, 1 FROM (
+                    SELECT 'source' AS dimension, new.source AS key
+                    UNION ALL SELECT 'category', COALESCE(new.category, '')
+                    UNION ALL SELECT 'no_phone', CAST(new.is_no_phone AS TEXT)
+                    UNION ALL SELECT 'salary', CAST(new.salary_min IS NOT NULL AS TEXT)
+                ) WHERE new.is_active = 1
+                ON CONFLICT (dimension, key) DO UPDATE SET count = count + 1;
+                
+                INSERT INTO last_scrapes (source, scraped_at) VALUES (new.source, new.scraped_at)
+                ON CONFLICT (source) DO UPDATE SET scraped_at = MAX(scraped_at, excluded.scraped_at);
+            END;
+            
+            CREATE TRIGGER IF NOT EXISTS job_counts_delete AFTER DELETE ON jobs
+            WHEN old.is_active = 1
+            BEGIN
+                UPDATE job_counts SET count = count - 1
+                WHERE (dimension = 'source' AND key = old.source)
+                   OR (dimension = 'category' AND key = COALESCE(old.category, ''))
+                   OR (dimension = 'no_phone' AND key = CAST(old.is_no_phone AS TEXT))
+                   OR (dimension = 'salary' AND key = CAST(old.salary_min IS NOT NULL AS TEXT));
+            END;
+            
+            CREATE TRIGGER IF NOT EXISTS job_counts_update
+            AFTER UPDATE OF is_active, source, category, is_no_phone, salary_min ON jobs
+            WHEN old.is_active IS NOT new.is_active OR old.source IS NOT new.source
+                OR old.category IS NOT new.category OR old.is_no_phone IS NOT new.is_no_phone
+                OR (old.salary_min IS NULL) IS NOT (new.salary_min IS NULL)
+            BEGIN
+                UPDATE job_counts SET count = count - 1
+                WHERE old.is_active = 1 AND (
+                    (dimension = 'source' AND key = old.source)
+                    OR (dimension = 'category' AND key = COALESCE(old.category, ''))
+                    OR (dimension = 'no_phone' AND key = CAST(old.is_no_phone AS TEXT))
+                    OR (dimension = 'salary' AND key = CAST(old.salary_min IS NOT NULL AS TEXT))
+                );
+                
+                INSERT INTO job_counts (dimension, key, count)
+                SELECT dimension, key, 1 FROM (
+                    SELECT 'source' AS dimension, new.source AS key
+                    UNION ALL SELECT 'category', COALESCE(new.category, '')
+                    UNION ALL SELECT 'no_phone', CAST(new.is_no_phone AS TEXT)
+                    UNION ALL SELECT 'salary', CAST(new.salary_min IS NOT NULL AS TEXT)
+                ) WHERE new.is_active = 1
+                ON CONFLICT (dimension, key) DO UPDATE SET count = count + 1;
+            END;
         """)
         self.conn.commit()
+        
+        if upgrading and version < 1:
+            self._migrate_descriptions()
+        if upgrading and version < 2:
+            self._migrate_lazy_scores()
+        if upgrading and version < 3:
+            self.rebuild_payloads()
+        if upgrading and version < 6:
+            self._migrate_payloads()
+        self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        
+        # Databases created before these tables existed need a one-time backfill
+        if 'jobs_fts' not in existing_tables:
+            self.rebuild_search_index()
+        if 'job_counts' not in existing_tables:
+            self.rebuild_stats()
+    
+    def _migrate_columns(self, existing_tables: set[str]):
+        """Add any COLUMN_MIGRATIONS columns missing from older tables."""
+        for table, migrations in COLUMN_MIGRATIONS.items():
+            if table not in existing_tables:
+                continue
+            columns = {row['name'] for row in self.conn.execute(f"PRAGMA table_info({table})")}
+            for name, definition in migrations.items():
+                if name not in columns:
+                    self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {definition}")
+        self.conn.commit()
+    
+    def _migrate_descriptions(self):
+        """Move inline jobs.description text into job_descriptions, one chunk per transaction."""
+        while True:
+            rows = self.conn.execute("""
+                SELECT id, description FROM jobs
+                WHERE description IS NOT NULL
+                LIMIT ?
+            """, (BULK_CHUNK_SIZE,)).fetchall()
+            if not rows:
+                break
+            
+            with self.conn:
+                self.conn.executemany("""
+                    INSERT OR REPLACE INTO job_descriptions (job_id, body) VALUES (?, ?)
+                """, [(row['id'], compress_text(row['description'])) for row in rows if row['description']])
+                self.conn.executemany("""
+                    UPDATE jobs SET snippet = ?, description = NULL WHERE id = ?
+                """, [(make_snippet(row['description']), row['id']) for row in rows])
+    
+    def _migrate_lazy_scores(self):
+        """Backfill jobs.lazy_score for rows written before it existed."""
+        with self.conn:
+            rows = self.conn.execute("""
+                SELECT id, is_no_phone, category, salary_min FROM jobs WHERE is_no_phone = 1
+            """).fetchall()
+            self.conn.executemany("UPDATE jobs SET lazy_score = ? WHERE id = ?", [
+                (lazy_score(dict(row)), row['id']) for row in rows
+            ])
+    
+    def _migrate_payloads(self):
+        """Move payloads stored inline in jobs.api_json (v3 to v5) into job_payloads."""
+        columns = {row['name'] for row in self.conn.execute("PRAGMA table_info(jobs)")}
+        if 'api_json' not in columns:
+            return
+        with self.conn:
+            self.conn.execute("""
+                INSERT OR REPLACE INTO job_payloads (job_id, body)
+                SELECT id, api_json FROM jobs WHERE api_json IS NOT NULL
+            """)
+            self.conn.execute("ALTER TABLE jobs DROP COLUMN api_json")
+    
+    def rebuild_payloads(self):
+        """Re-serialize every job's payload into job_payloads, one chunk per transaction."""
+        last_rowid = 0
+        while True:
+            rows = self.conn.execute("""
+                SELECT rowid, id FROM jobs WHERE rowid > ? ORDER BY rowid LIMIT ?
+            """, (last_rowid, BULK_CHUNK_SIZE)).fetchall()
+            if not rows:
+                break
+            with self.conn:
+                self._refresh_payloads([row['id'] for row in rows])
+            last_rowid = rows[-1][0]
+    
+    def _refresh_payloads(self, ids: list[str]):
+        """Serialize the stored rows of these jobs into job_payloads."""
+        rows = self.conn.execute(f"""
+            SELECT {', '.join(PAYLOAD_COLUMNS)} FROM jobs
+            WHERE id IN ({','.join('?' * len(ids))})
+        """, ids).fetchall()
+        self.conn.executemany("INSERT OR REPLACE INTO job_payloads (job_id, body) VALUES (?, ?)", [
+            (row['id'], job_payload(row)) for row in rows
+        ])
+    
+    def rebuild_search_index(self):
+        """Rebuild the full-text index from jobs and job_descriptions."""
+        with self.conn:
+            self.conn.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('delete-all')")
+            cursor = self.conn.execute("""
+                SELECT jobs.rowid, jobs.title, jobs.company, jobs.tags, d.body
+                FROM jobs LEFT JOIN job_descriptions d ON d.job_id = jobs.id
+            """)
+            while rows := cursor.fetchmany(BULK_CHUNK_SIZE):
+                self.conn.executemany("""
+                    INSERT INTO jobs_fts (rowid, title, company, description, tags)
+                    VALUES (?, ?, ?, ?, ?)
+                """, [
+                    (row[0], row['title'], row['company'], decompress_text(row['body']), row['tags'])
+                    for row in rows
+                ])
+    
+    def rebuild_stats(self):
+        """Recompute the job_counts and last_scrapes tables from the jobs table."""
+        with self.conn:
+            self.conn.execute("DELETE FROM job_counts")
+            self.conn.execute("""
+                INSERT INTO job_counts (dimension, key, count)
+                SELECT 'source', source, COUNT(*) FROM jobs WHERE is_active = 1 GROUP BY 1, 2
+                UNION ALL
+                SELECT 'category', COALESCE(category, ''), COUNT(*) FROM jobs WHERE is_active = 1 GROUP BY 1, 2
+                UNION ALL
+                SELECT 'no_phone', CAST(is_no_phone AS TEXT), COUNT(*) FROM jobs WHERE is_active = 1 GROUP BY 1, 2
+                UNION ALL
+                SELECT 'salary', CAST(salary_min IS NOT NULL AS TEXT), COUNT(*) FROM jobs WHERE is_active = 1 GROUP BY 1, 2
+            """)
+            self.conn.execute("DELETE FROM last_scrapes")
+            self.conn.execute("""
+                INSERT INTO last_scrapes (source, scraped_at)
+                SELECT source, MAX(scraped_at) FROM jobs GROUP BY source
+            """)
     
     def upsert_job(self, job_data: dict) -> tuple[bool, bool]:
         """
         Insert or update a job.
         Returns (is_new, is_updated).
         """
-        cursor = self.conn.cursor()
+        new_count, updated_count = self.bulk_upsert_jobs([job_data])
+        return new_count > 0, updated_count > 0
+    
+    def bulk_upsert_jobs(self, jobs: Iterable[dict]) -> tuple[int, int]:
+        """
+        Insert or update a batch of jobs in a single transaction.
         
-        # Check if job exists
-        cursor.execute("SELECT id, title, salary_min, salary_max FROM jobs WHERE id = ?", 
-                      (job_data['id'],))
-        existing = cursor.fetchone()
-        
-        if existing:
-            # Update existing job
-            cursor.execute("""
-                UPDATE jobs SET
-                    title = ?,
-                    company = ?,
-                    company_logo = ?,
-                    description = ?,
-                    location = ?,
-                    salary_min = ?,
-                    salary_max = ?,
-                    url = ?,
-                    apply_url = ?,
-                    tags = ?,
-                    category = ?,
-                    is_no_phone = ?,
-                    updated_at = ?,
-                    is_active = 1
-                WHERE id = ?
-            """, (
-                job_data['title'],
-                job_data['company'],
-                job_data.get('company_logo'),
-                job_data.get('description'),
-                job_data.get('location'),
-                job_data.get('salary_min'),
-                job_data.get('salary_max'),
-                job_data['url'],
-                job_data.get('apply_url'),
-                job_data.get('tags'),
-                job_data.get('category'),
-                job_data.get('is_no_phone', False),
-                datetime.utcnow().isoformat(),
-                job_data['id']
+        Jobs whose content fingerprint matches the stored row only get their
+        last_seen_at touched (and are reactivated if needed); only new or
+        changed jobs are written in full.
+        Returns (new_count, updated_count), where updated means content changed.
+        """
+        new_count = 0
+        updated_count = 0
+        now = datetime.utcnow().isoformat()
+        jobs = iter(jobs)
+        
+        with self.conn:
+            cursor = self.conn.cursor()
+            while True:
+                chunk = list(islice(jobs, BULK_CHUNK_SIZE))
+                if not chunk:
+                    break
+                
+                # One keyed read per chunk tells us which rows exist and what they held
+                ids = [job_data['id'] for job_data in chunk]
+                placeholders = ",".join("?" * len(ids))
+                cursor.execute(f"""
+                    SELECT id, content_hash FROM jobs
+                    WHERE id IN ({placeholders})
+                """, ids)
+                stored = {row['id']: row['content_hash'] for row in cursor.fetchall()}
+                indexed = set(stored)
+                
+                writes: dict[str, tuple[dict, str]] = {}
+                touches = []
+                for job_data in chunk:
+                    content_hash = fingerprint(job_data)
+                    if job_data['id'] not in stored:
+                        new_count += 1
+                    elif stored[job_data['id']] == content_hash:
+                        touches.append(job_data['id'])
+                        continue
+                    else:
+                        updated_count += 1
+                    # Later duplicates of this id inside the batch compare against (and replace) this version
+                    stored[job_data['id']] = content_hash
+                    writes[job_data['id']] = (job_data, content_hash)
+                
+                # The search index needs the old values, so it lets go of them first
+                self._unindex([job_id for job_id in writes if job_id in indexed])
+                cursor.executemany("""
+                    INSERT INTO jobs (
+                        id, source, source_id, title, company, company_logo,
+                        snippet, location, salary_min, salary_max, salary_currency,
+                        url, apply_url, tags, category, is_no_phone, posted_at, scraped_at,
+                        updated_at, content_hash, last_seen_at, lazy_score
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(id) DO UPDATE SET
+                        title = excluded.title,
+                        company = excluded.company,
+                        company_logo = excluded.company_logo,
+                        snippet = excluded.snippet,
+                        location = excluded.location,
+                        salary_min = excluded.salary_min,
+                        salary_max = excluded.salary_max,
+                        salary_currency = excluded.salary_currency,
+                        url = excluded.url,
+                        apply_url = excluded.apply_url,
+                        tags = excluded.tags,
+                        category = excluded.category,
+                        is_no_phone = excluded.is_no_phone,
+                        updated_at = excluded.updated_at,
+                        content_hash = excluded.content_hash,
+                        last_seen_at = excluded.last_seen_at,
+                        lazy_score = excluded.lazy_score,
+                        is_active = 1
+                """, [
+                    (
+                        job_data['id'],
+                        job_data['source'],
+                        job_data.get('source_id'),
+                        job_data['title'],
+                        job_data.get('company'),
+                        job_data.get('company_logo'),
+                        make_snippet(job_data.get('description')),
+                        job_data.get('location'),
+                        job_data.get('salary_min'),
+                        job_data.get('salary_max'),
+                        job_data.get('salary_currency', 'USD'),
+                        job_data['url'],
+                        job_data.get('apply_url'),
+                        job_data.get('tags'),
+                        job_data.get('category'),
+                        job_data.get('is_no_phone', False),
+                        job_data.get('posted_at'),
+                        job_data.get('scraped_at', now),
+                        now,
+                        content_hash,
+                        now,
+                        lazy_score(job_data),
+                    )
+                    for job_data, content_hash in writes.values()
+                ])
+                
+                if writes:
+                    self._write_dependents([job_data for job_data, _ in writes.values()])
+                
+                if touches:
+                    self._mark_seen(touches, now)
+        
+        return new_count, updated_count
+    
+    def touch_jobs(self, ids: Iterable[str]) -> int:
+        """
+        Mark jobs as seen now without rewriting them, for listings on pages
+        that were unchanged since the last scrape. Returns rows touched.
+        """
+        now = datetime.utcnow().isoformat()
+        touched = 0
+        ids = iter(ids)
+        with self.conn:
+            while chunk := list(islice(ids, BULK_CHUNK_SIZE)):
+                touched += self._mark_seen(chunk, now)
+        return touched
+    
+    def _mark_seen(self, ids: list[str], now: str) -> int:
+        """
+        Set last_seen_at on stored jobs, reactivating inactive ones. A
+        reactivation also bumps updated_at (and the stored payload), since
+        is_active is part of what the API serves. Returns rows touched.
+        """
+        placeholders = ",".join("?" * len(ids))
+        revived = [row[0] for row in self.conn.execute(
+            f"SELECT id FROM jobs WHERE id IN ({placeholders}) AND is_active = 0", ids
+        )]
+        cursor = self.conn.execute(f"""
+            UPDATE jobs SET
+                last_seen_at = ?,
+                updated_at = CASE WHEN is_active = 0 THEN ? ELSE updated_at END,
+                is_active = 1
+            WHERE id IN ({placeholders})
+        """, [now, now, *ids])
+        if revived:
+            self._refresh_payloads(revived)
+        return cursor.rowcount
+
+    def missing_job_ids(self, ids: list[str]) -> set[str]:
+        """The given ids with no row in jobs (never saved, or since purged or archived)."""
+        missing = set(ids)
+        for start in range(0, len(ids), BULK_CHUNK_SIZE):
+            chunk = ids[start:start + BULK_CHUNK_SIZE]
+            missing.difference_update(row[0] for row in self.conn.execute(
+                f"SELECT id FROM jobs WHERE id IN ({','.join('?' * len(chunk))})", chunk
             ))
-            self.conn.commit()
+        return missing
+
+    def _unindex(self, ids: list[str]):
+        """Drop stored jobs from the contentless search index, before their rows are rewritten."""
+        if not ids:
+            return
+        self.conn.execute(f"""
+            INSERT INTO jobs_fts (jobs_fts, rowid, title, company, description, tags)
+            SELECT 'delete', jobs.rowid, jobs.title, jobs.company, decompress_text(d.body), jobs.tags
+            FROM jobs LEFT JOIN job_descriptions d ON d.job_id = jobs.id
+            WHERE jobs.id IN ({','.join('?' * len(ids))})
+        """, ids)
+    
+    def _write_dependents(self, jobs: list[dict]):
+        """Store compressed descriptions, refresh search rows and re-serialize payloads for freshly written jobs."""
+        ids = [job_data['id'] for job_data in jobs]
+        rowids = dict(self.conn.execute(
+            f"SELECT id, rowid FROM jobs WHERE id IN ({','.join('?' * len(ids))})", ids
+        ).fetchall())
+        
+        self.conn.executemany("""
+            INSERT INTO jobs_fts (rowid, title, company, description, tags)
+            VALUES (?, ?, ?, ?, ?)
+        """, [
+            (rowids[job_data['id']], job_data['title'], job_data.get('company'),
+             job_data.get('description'), job_data.get('tags'))
+            for job_data in jobs
+        ])
+        
+        self.conn.executemany("""
+            INSERT OR REPLACE INTO job_descriptions (job_id, body) VALUES (?, ?)
+        """, [
+            (job_data['id'], compress_text(job_data['description']))
+            for job_data in jobs if job_data.get('description')
+        ])
+        self.conn.executemany("DELETE FROM job_descriptions WHERE job_id = ?", [
+            (job_data['id'],) for job_data in jobs if not job_data.get('description')
+        ])
+        
+        # Serialized from the stored rows, which keep their original scraped_at
+        self._refresh_payloads(ids)
+    
+    def get_description(self, job_id: str) -> Optional[str]:
+        """Load and decompress one job's full description."""
+        row = self.conn.execute(
+            "SELECT body FROM job_descriptions WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        return decompress_text(row['body']) if row else None
+    
+    def _load_descriptions(self, ids: list[str]) -> dict[str, str]:
+        """Full descriptions for a batch of job ids (missing ids are omitted)."""
+        if not ids:
+            return {}
+        rows = self.conn.execute(
+            f"SELECT job_id, body FROM job_descriptions WHERE job_id IN ({','.join('?' * len(ids))})", ids
+        ).fetchall()
+        return {row['job_id']: decompress_text(row['body']) for row in rows}
+    
+    def expire_stale_jobs(
+        self,
+        source: str,
+        run_started: datetime,
+        grace_days: float = EXPIRY_GRACE_DAYS
+    ) -> int:
+        """
+        Sweep a source after a successful scrape: deactivate its active jobs
+        that have not been seen since grace_days before run_started.
+        Sub-sources (e.g. jobspy_indeed for jobspy) are swept with their parent.
+        Deactivated jobs get a fresh updated_at (the API serves is_active);
+        last_seen_at is pinned first so retention still counts from it.
+        Returns the number of jobs deactivated.
+        """
+        cutoff = (run_started - timedelta(days=grace_days)).isoformat()
+        now = datetime.utcnow().isoformat()
+        with self.conn:
+            ids = [row[0] for row in self.conn.execute("""
+                SELECT id FROM jobs
+                WHERE (source = ? OR source LIKE ? ESCAPE '\\')
+                AND is_active = 1
+                AND COALESCE(last_seen_at, updated_at, scraped_at) < ?
+            """, (source, source.replace('_', '\\_') + '\\_%', cutoff))]
+            for start in range(0, len(ids), BULK_CHUNK_SIZE):
+                chunk = ids[start:start + BULK_CHUNK_SIZE]
+                self.conn.execute(f"""
+                    UPDATE jobs SET
+                        last_seen_at = COALESCE(last_seen_at, updated_at, scraped_at),
+                        updated_at = ?,
+                        is_active = 0
+                    WHERE id IN ({','.join('?' * len(chunk))})
+                """, [now, *chunk])
+                self._refresh_payloads(chunk)
+        return len(ids)
+    
+    def purge_inactive_jobs(self, retention_days: float = RETENTION_DAYS) -> int:
+        """Delete inactive jobs last seen more than retention_days ago. Returns rows deleted."""
+        cutoff = (datetime.utcnow() - timedelta(days=retention_days)).isoformat()
+        with self.conn:
+            cursor = self.conn.execute("""
+                DELETE FROM jobs
+                WHERE is_active = 0
+                AND COALESCE(last_seen_at, updated_at, scraped_at) < ?
+            """, (cutoff,))
+        return cursor.rowcount
+    
+    def archive_jobs(
+        self,
+        archive: "JobArchive",
+        older_than_days: float = 0.0,
+        chunk_size: int = ARCHIVE_CHUNK_SIZE
+    ) -> int:
+        """
+        Move inactive jobs last seen more than older_than_days ago into the
+        archive, one chunk per transaction. Each chunk is written to the
+        archive before it is deleted here, so an interrupted run loses nothing.
+        A job a concurrent scrape revives before its chunk is deleted stays
+        live and is taken back out of the archive.
+        Returns the number of jobs moved.
+        """
+        cutoff = (datetime.utcnow() - timedelta(days=older_than_days)).isoformat()
+        moved = 0
+        
+        while True:
+            rows = self.conn.execute("""
+                SELECT * FROM jobs
+                WHERE is_active = 0
+                AND COALESCE(last_seen_at, updated_at, scraped_at) < ?
+                LIMIT ?
+            """, (cutoff, chunk_size)).fetchall()
+            if not rows:
+                break
             
-            # Check if anything meaningful changed
-            changed = (existing['title'] != job_data['title'] or
-                      existing['salary_min'] != job_data.get('salary_min') or
-                      existing['salary_max'] != job_data.get('salary_max'))
+            ids = [row['id'] for row in rows]
+            descriptions = self._load_descriptions(ids)
+            archive.add_jobs([
+                {**dict(row), 'description': descriptions.get(row['id'])} for row in rows
+            ])
             
-            return False, changed
-        else:
-            # Insert new job
-            cursor.execute("""
-                INSERT INTO jobs (
-                    id, source, source_id, title, company, company_logo,
-                    description, location, salary_min, salary_max, salary_currency,
-                    url, apply_url, tags, category, is_no_phone, posted_at, scraped_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                job_data['id'],
-                job_data['source'],
-                job_data.get('source_id'),
-                job_data['title'],
-                job_data.get('company'),
-                job_data.get('company_logo'),
-                job_data.get('description'),
-                job_data.get('location'),
-                job_data.get('salary_min'),
-                job_data.get('salary_max'),
-                job_data.get('salary_currency', 'USD'),
-                job_data['url'],
-                job_data.get('apply_url'),
-                job_data.get('tags'),
-                job_data.get('category'),
-                job_data.get('is_no_phone', False),
-                job_data.get('posted_at'),
-                job_data.get('scraped_at', datetime.utcnow().isoformat())
-            ))
-            self.conn.commit()
-            return True, False
+            placeholders = ','.join('?' * len(ids))
+            with self.conn:
+                # Re-checked here: a scrape may have touched or rewritten a job since the SELECT
+                deleted = self.conn.execute(f"""
+                    DELETE FROM jobs
+                    WHERE id IN ({placeholders})
+                    AND is_active = 0
+                    AND COALESCE(last_seen_at, updated_at, scraped_at) < ?
+                """, (*ids, cutoff)).rowcount
+                kept = [row[0] for row in self.conn.execute(
+                    f"SELECT id FROM jobs WHERE id IN ({placeholders})", ids
+                )]
+            if kept:
+                archive.remove_jobs(kept)
+            moved += deleted
+        
+        return moved
     
     def get_jobs(
         self,
@@ -170,97 +936,203 @@ class JobDatabase:
         has_salary: bool = False,
         limit: int = 100,
         offset: int = 0,
-        active_only: bool = True
+        active_only: bool = True,
+        cursor: Optional[str] = None,
+        with_description: bool = False,
+        columns: tuple[str, ...] = LIST_COLUMNS
     ) -> list[dict]:
-        """Query jobs with filters."""
-        query = "SELECT * FROM jobs WHERE 1=1"
+        """
+        Query jobs with filters, newest first.
+        
+        Pass a cursor from encode_cursor(last_job) to continue after that job
+        without OFFSET; offset is ignored when a cursor is given.
+        Rows carry a short snippet; with_description also loads full descriptions.
+        columns selects what each row holds (e.g. PAYLOAD_SELECT for stored JSON);
+        it must include id when loading descriptions and scraped_at for cursors.
+        """
+        where, params = self._job_filters(category, source, no_phone_only, has_salary, active_only)
+        query = f"SELECT {select_list(columns)} FROM jobs WHERE {where}"
+        
+        if cursor:
+            query += " AND (scraped_at, id) < (?, ?)"
+            params.extend(decode_cursor(cursor))
+            offset = 0
+        
+        query += " ORDER BY scraped_at DESC, id DESC LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+        
+        rows = [dict(row) for row in self.conn.execute(query, params).fetchall()]
+        
+        if with_description:
+            descriptions = self._load_descriptions([row['id'] for row in rows])
+            for row in rows:
+                row['description'] = descriptions.get(row['id'])
+        
+        return rows
+    
+    def iter_jobs(
+        self,
+        chunk_size: int = EXPORT_CHUNK_SIZE,
+        columns: tuple[str, ...] = LIST_COLUMNS,
+        **filters
+    ) -> Iterator[dict]:
+        """
+        Yield every job get_jobs(**filters) matches, newest first, without
+        materializing the result (see iter_jobs_keyset).
+        """
+        return iter_jobs_keyset(lambda: nullcontext(self), chunk_size, columns, **filters)
+    
+    @staticmethod
+    def _job_filters(
+        category: Optional[str],
+        source: Optional[str],
+        no_phone_only: bool,
+        has_salary: bool,
+        active_only: bool
+    ) -> tuple[str, list]:
+        """WHERE clause and parameters for get_jobs (and so iter_jobs)."""
+        clauses = ["1=1"]
         params = []
         
         if active_only:
-            query += " AND is_active = 1"
+            clauses.append("is_active = 1")
         
         if category:
-            query += " AND category = ?"
+            clauses.append("category = ?")
             params.append(category)
         
         if source:
-            query += " AND source = ?"
+            clauses.append("source = ?")
             params.append(source)
         
         if no_phone_only:
-            query += " AND is_no_phone = 1"
+            clauses.append("is_no_phone = 1")
         
         if has_salary:
-            query += " AND salary_min IS NOT NULL"
+            clauses.append("salary_min IS NOT NULL")
+        
+        return " AND ".join(clauses), params
+    
+    def get_lazy_jobs(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        columns: tuple[str, ...] = LIST_COLUMNS
+    ) -> list[dict]:
+        """
+        The lazy-girl feed: active no-phone jobs by lazy_score, newest first
+        within a score. Served straight from idx_jobs_lazy_feed.
         
-        query += " ORDER BY scraped_at DESC LIMIT ? OFFSET ?"
+        Pass encode_cursor(last_job, LAZY_FEED_KEYS) as cursor to continue
+        after that job; offset is ignored when a cursor is given.
+        """
+        query = f"""
+            SELECT {select_list(columns)}, lazy_score FROM jobs
+            WHERE is_active = 1 AND lazy_score IS NOT NULL
+        """
+        params: list = []
+        
+        if cursor:
+            query += " AND (lazy_score, scraped_at, id) < (?, ?, ?)"
+            params.extend(decode_cursor(cursor, (int, str, str)))
+            offset = 0
+        
+        query += " ORDER BY lazy_score DESC, scraped_at DESC, id DESC LIMIT ? OFFSET ?"
         params.extend([limit, offset])
         
-        cursor = self.conn.cursor()
-        cursor.execute(query, params)
+        return [dict(row) for row in self.conn.execute(query, params).fetchall()]
+    
+    def get_job_by_id(self, job_id: str, with_description: bool = True) -> Optional[dict]:
+        """Look up one job (active or not) by primary key."""
+        row = self.conn.execute(
+            f"SELECT {', '.join(LIST_COLUMNS)} FROM jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+        if row is None:
+            return None
         
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        job = dict(row)
+        if with_description:
+            job['description'] = self.get_description(job_id)
+        return job
     
-    def search_jobs(self, query: str, limit: int = 50) -> list[dict]:
-        """Full-text search in title and description."""
-        cursor = self.conn.cursor()
-        search_term = f"%{query}%"
+    def get_jobs_by_ids(self, ids: list[str]) -> list[dict]:
+        """Fetch a batch of jobs (active or not) by primary key, in the order given; unknown ids are skipped."""
+        if not ids:
+            return []
+        rows = self.conn.execute(
+            f"SELECT {', '.join(LIST_COLUMNS)} FROM jobs WHERE id IN ({','.join('?' * len(ids))})", ids
+        ).fetchall()
+        by_id = {row['id']: dict(row) for row in rows}
+        return [by_id[job_id] for job_id in dict.fromkeys(ids) if job_id in by_id]
+    
+    def search_jobs(self, query: str, limit: int = 50, columns: tuple[str, ...] = LIST_COLUMNS) -> list[dict]:
+        """Full-text search in title, company, description and tags, ranked by relevance and recency."""
+        # Quote each word so user input can never be parsed as FTS5 query syntax
+        terms = re.findall(r'\w+', query)
+        if not terms:
+            return []
+        match = " ".join(f'"{term}"' for term in terms)
+        # Only the word being typed is prefix-matched, and only once the
+        # jobs_fts prefix indexes cover it; one letter would expand to a
+        # large slice of the vocabulary
+        if len(terms[-1]) >= SEARCH_PREFIX_MIN:
+            match += "*"
         
-        cursor.execute("""
-            SELECT * FROM jobs 
-            WHERE is_active = 1 
-            AND (title LIKE ? OR description LIKE ? OR company LIKE ?)
-            ORDER BY scraped_at DESC
+        cursor = self.conn.cursor()
+        cursor.execute(f"""
+            SELECT {select_list(columns, "jobs")} FROM (
+                -- Candidates are the newest active matches, so expired rows
+                -- awaiting purge never crowd live ones out of the ranking
+                SELECT jobs_fts.rowid AS rowid, bm25(jobs_fts, {", ".join(map(str, SEARCH_WEIGHTS))}) AS score
+                FROM jobs_fts
+                JOIN jobs ON jobs.rowid = jobs_fts.rowid
+                WHERE jobs_fts MATCH ?
+                AND jobs.is_active = 1
+                ORDER BY jobs_fts.rowid DESC
+                LIMIT ?
+            ) AS hits
+            JOIN jobs ON jobs.rowid = hits.rowid
+            ORDER BY hits.score / (1.0 + MAX(julianday('now') - julianday(jobs.scraped_at), 0) / ?)
             LIMIT ?
-        """, (search_term, search_term, search_term, limit))
+        """, (match, max(SEARCH_CANDIDATES, limit), SEARCH_RECENCY_DAYS, limit))
         
         return [dict(row) for row in cursor.fetchall()]
     
     def get_stats(self) -> dict:
-        """Get database statistics."""
+        """Get database statistics from the trigger-maintained counter tables."""
         cursor = self.conn.cursor()
         
-        stats = {}
-        
-        # Total jobs
-        cursor.execute("SELECT COUNT(*) FROM jobs WHERE is_active = 1")
-        stats['total_jobs'] = cursor.fetchone()[0]
-        
-        # By source
+        counts: dict[str, dict[str, int]] = {}
         cursor.execute("""
-            SELECT source, COUNT(*) as count 
-            FROM jobs WHERE is_active = 1 
-            GROUP BY source
+            SELECT dimension, key, count FROM job_counts
+            WHERE count > 0
+            ORDER BY dimension, count DESC, key
         """)
-        stats['by_source'] = {row['source']: row['count'] for row in cursor.fetchall()}
-        
-        # By category
-        cursor.execute("""
-            SELECT category, COUNT(*) as count 
-            FROM jobs WHERE is_active = 1 
-            GROUP BY category
-            ORDER BY count DESC
-        """)
-        stats['by_category'] = {row['category']: row['count'] for row in cursor.fetchall()}
-        
-        # No-phone jobs
-        cursor.execute("SELECT COUNT(*) FROM jobs WHERE is_active = 1 AND is_no_phone = 1")
-        stats['no_phone_jobs'] = cursor.fetchone()[0]
+        for row in cursor.fetchall():
+            counts.setdefault(row['dimension'], {})[row['key']] = row['count']
         
-        # With salary
-        cursor.execute("SELECT COUNT(*) FROM jobs WHERE is_active = 1 AND salary_min IS NOT NULL")
-        stats['with_salary'] = cursor.fetchone()[0]
+        stats = {}
+        stats['by_source'] = dict(sorted(counts.get('source', {}).items()))
+        stats['total_jobs'] = sum(stats['by_source'].values())
+        # Uncategorized jobs are stored under '' since NULL can't be a key
+        stats['by_category'] = {
+            (category or None): count
+            for category, count in counts.get('category', {}).items()
+        }
+        stats['no_phone_jobs'] = counts.get('no_phone', {}).get('1', 0)
+        stats['with_salary'] = counts.get('salary', {}).get('1', 0)
         
-        # Last scrape
-        cursor.execute("""
-            SELECT source, MAX(scraped_at) as last_scrape 
-            FROM jobs GROUP BY source
-        """)
-        stats['last_scrape'] = {row['source']: row['last_scrape'] for row in cursor.fetchall()}
+        cursor.execute("SELECT source, scraped_at FROM last_scrapes ORDER BY source")
+        stats['last_scrape'] = {row['source']: row['scraped_at'] for row in cursor.fetchall()}
         
         return stats
     
+    def get_data_version(self) -> int:
+        """Counter bumped each time a scrape finishes writing."""
+        row = self.conn.execute("SELECT version FROM data_version WHERE id = 1").fetchone()
+        return row[0] if row else 0
+    
     def log_scrape(self, source: str) -> int:
         """Start logging a scrape run."""
         cursor = self.conn.cursor()
@@ -278,9 +1150,10 @@ class JobDatabase:
         jobs_new: int, 
         jobs_updated: int,
         status: str = 'success',
-        error: Optional[str] = None
+        error: Optional[str] = None,
+        jobs_expired: int = 0
     ):
-        """Finish logging a scrape run."""
+        """Finish logging a scrape run and bump the data version."""
         cursor = self.conn.cursor()
         cursor.execute("""
             UPDATE scrape_log SET
@@ -288,6 +1161,7 @@ class JobDatabase:
                 jobs_found = ?,
                 jobs_new = ?,
                 jobs_updated = ?,
+                jobs_expired = ?,
                 status = ?,
                 error = ?
             WHERE id = ?
@@ -296,13 +1170,92 @@ class JobDatabase:
             jobs_found,
             jobs_new,
             jobs_updated,
+            jobs_expired,
             status,
             error,
             log_id
         ))
+        cursor.execute("UPDATE data_version SET version = version + 1 WHERE id = 1")
         self.conn.commit()
     
+    def bump_data_version(self):
+        """Invalidate cached API responses after writes made outside finish_scrape."""
+        with self.conn:
+            self.conn.execute("UPDATE data_version SET version = version + 1 WHERE id = 1")
+    
     def close(self):
         """Close database connection."""
         if self.conn:
             self.conn.close()
+
+
+class ConnectionPool:
+    """
+    Process-wide SQLite connections for the API.
+    
+    Read connections are pooled and handed out one request at a time; all
+    writes go through a single connection serialized by a lock, which is
+    what SQLite allows anyway. The schema is bootstrapped once, here.
+    """
+    
+    def __init__(self, db_path: str = "data/jobs.db", size: int = 8):
+        self.db_path = Path(db_path)
+        self.size = size
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        
+        # Opening the writer through JobDatabase runs the schema script once
+        self._writer = JobDatabase(self.db_path).conn
+    
+    def _acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                return connect(self.db_path, read_only=True)
+        
+        return self._idle.get()
+    
+    @contextmanager
+    def reader(self) -> Iterator[JobDatabase]:
+        """Borrow a read-only connection for the duration of the block."""
+        conn = self._acquire()
+        try:
+            yield JobDatabase(self.db_path, conn=conn)
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put(conn)
+    
+    @contextmanager
+    def writer(self) -> Iterator[JobDatabase]:
+        """Hold the single writer connection for the duration of the block."""
+        with self._write_lock:
+            try:
+                yield JobDatabase(self.db_path, conn=self._writer)
+            finally:
+                if self._writer.in_transaction:
+                    self._writer.rollback()
+    
+    def iter_jobs(self, **kwargs) -> Iterator[dict]:
+        """
+        JobDatabase.iter_jobs, borrowing a reader for each page only, so a
+        stalled export never pins a pooled connection or a WAL snapshot.
+        """
+        return iter_jobs_keyset(self.reader, **kwargs)
+    
+    def close(self):
+        """Close every pooled connection."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._write_lock:
+            self._writer.close()
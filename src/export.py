@@ -0,0 +1,69 @@
+"""Streaming serializers for job exports (CLI and API)."""
+
+import csv
+import io
+import json
+from typing import Iterable, Iterator, Optional
+
+from src.database import LIST_COLUMNS
+
+
+# Columns written to CSV exports, in order
+CSV_FIELDS = LIST_COLUMNS + ('description',)
+
+# Jobs serialized per yielded text chunk, so writers and sockets see a few
+# large writes instead of one per row
+ROWS_PER_CHUNK = 100
+
+
+def _with_tag_list(job: dict) -> dict:
+    """Decode the JSON-encoded tags column for JSON output."""
+    if job.get('tags') and isinstance(job['tags'], str):
+        try:
+            job['tags'] = json.loads(job['tags'])
+        except ValueError:
+            job['tags'] = []
+    return job
+
+
+def iter_ndjson(jobs: Iterable[dict], fields: Optional[tuple[str, ...]] = None) -> Iterator[str]:
+    """Serialize jobs as newline-delimited JSON, one object per line (fields is accepted for parity with iter_csv)."""
+    lines = []
+    for job in jobs:
+        lines.append(json.dumps(_with_tag_list(job), default=str) + "\n")
+        if len(lines) >= ROWS_PER_CHUNK:
+            yield "".join(lines)
+            lines = []
+    if lines:
+        yield "".join(lines)
+
+
+def iter_json_array(jobs: Iterable[dict], fields: Optional[tuple[str, ...]] = None) -> Iterator[str]:
+    """Serialize jobs as one indented JSON array, written incrementally (fields is accepted for parity with iter_csv)."""
+    yield "["
+    separator = "\n"
+    chunk = []
+    for job in jobs:
+        chunk.append(separator + json.dumps(_with_tag_list(job), indent=2, default=str))
+        separator = ",\n"
+        if len(chunk) >= ROWS_PER_CHUNK:
+            yield "".join(chunk)
+            chunk = []
+    chunk.append("\n]\n")
+    yield "".join(chunk)
+
+
+def iter_csv(jobs: Iterable[dict], fields: Optional[tuple[str, ...]] = None) -> Iterator[str]:
+    """Serialize jobs as CSV with a header row; tags stay JSON-encoded."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields or CSV_FIELDS, extrasaction='ignore')
+    writer.writeheader()
+    rows = 0
+    for job in jobs:
+        writer.writerow(job)
+        rows += 1
+        if rows % ROWS_PER_CHUNK == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
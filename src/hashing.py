@@ -0,0 +1,194 @@
+"""Password hashing off the request threadpool, with admission control and metrics."""
+
+import asyncio
+import hashlib
+import hmac
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+import bcrypt
+
+
+BCRYPT_ROUNDS = 12
+
+# Seconds a successful credential check is remembered (NextAuth re-verifies often)
+VERIFY_CACHE_TTL = 60.0
+VERIFY_CACHE_SIZE = 1024
+
+# Recent samples kept for the wait/run time percentiles
+METRIC_WINDOW = 256
+
+
+class HasherSaturated(Exception):
+    """Raised when the hashing queue is full; callers should retry later."""
+
+
+class HasherUnavailable(Exception):
+    """Raised when a hash could not be computed in time or the pool died."""
+
+
+def _hash_password(password: bytes, rounds: int) -> tuple[bytes, float]:
+    """Worker: bcrypt-hash a password. Returns (hash, wall-clock start time)."""
+    started = time.time()
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds)), started
+
+
+def _check_password(password: bytes, password_hash: bytes) -> tuple[bool, float]:
+    """Worker: check a password against a bcrypt hash. Returns (matches, wall-clock start time)."""
+    started = time.time()
+    return bcrypt.checkpw(password, password_hash), started
+
+
+def _percentile(samples, fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt in a dedicated process pool so hashing neither holds the
+    GIL nor occupies the request threadpool.
+
+    At most `workers + max_queue` operations are admitted at once; beyond
+    that hash()/check() raise HasherSaturated immediately instead of
+    queueing, and an operation that is not done within `timeout` seconds
+    raises HasherUnavailable (it stays admitted until the pool finishes or
+    drops it, so timeouts cannot hide real load). Successful checks are remembered for
+    VERIFY_CACHE_TTL seconds under an HMAC of the credentials and stored
+    hash (keyed per process), so a changed password never hits the cache.
+    """
+
+    def __init__(self, workers: int = 2, max_queue: int = 16, timeout: float = 10.0):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+
+        self._cache_key = os.urandom(32)
+        self._verified: OrderedDict[bytes, float] = OrderedDict()
+
+        self.completed = 0
+        self.rejected = 0
+        self.failed = 0
+        self.cache_hits = 0
+        self._waits: deque[float] = deque(maxlen=METRIC_WINDOW)
+        self._runs: deque[float] = deque(maxlen=METRIC_WINDOW)
+        self._started_at = time.monotonic()
+
+    def _executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # Spawned, not forked: the API process is multi-threaded by the time
+                # the first hash runs, and a forked child can inherit a held lock
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._pool
+
+    async def _submit(self, fn, *args):
+        """Run fn in the pool under admission control; returns its result (without the start time)."""
+        with self._lock:
+            if self._pending >= self.workers + self.max_queue:
+                self.rejected += 1
+                raise HasherSaturated()
+            self._pending += 1
+
+        submitted = time.time()
+        try:
+            future = self._executor().submit(fn, *args)
+        except BrokenProcessPool as e:
+            self._release()
+            self._fail(broken=True)
+            raise HasherUnavailable() from e
+        # The operation stays admitted until the pool is really done with it,
+        # even after its caller has timed out
+        future.add_done_callback(self._release)
+
+        try:
+            result, started = await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except (asyncio.TimeoutError, BrokenProcessPool) as e:
+            self._fail(broken=isinstance(e, BrokenProcessPool))
+            raise HasherUnavailable() from e
+
+        finished = time.time()
+        with self._lock:
+            self.completed += 1
+            self._waits.append(max(started - submitted, 0.0))
+            self._runs.append(finished - started)
+        return result
+
+    def _release(self, _future=None):
+        with self._lock:
+            self._pending -= 1
+
+    def _fail(self, broken: bool):
+        with self._lock:
+            self.failed += 1
+            if broken:
+                # A worker died; the next operation starts a fresh pool
+                self._pool = None
+
+    async def hash(self, password: str) -> str:
+        """bcrypt-hash a password for storage."""
+        password_hash = await self._submit(_hash_password, password.encode(), BCRYPT_ROUNDS)
+        return password_hash.decode()
+
+    async def check(self, email: str, password: str, password_hash: str) -> bool:
+        """Check a password against a stored hash, consulting the short-lived verify cache first."""
+        key = hmac.new(
+            self._cache_key, "\0".join((email, password, password_hash)).encode(), hashlib.sha256
+        ).digest()
+        now = time.monotonic()
+        with self._lock:
+            expires_at = self._verified.get(key)
+            if expires_at is not None:
+                if expires_at > now:
+                    self.cache_hits += 1
+                    return True
+                del self._verified[key]
+
+        if not await self._submit(_check_password, password.encode(), password_hash.encode()):
+            return False
+
+        with self._lock:
+            self._verified[key] = now + VERIFY_CACHE_TTL
+            while len(self._verified) > VERIFY_CACHE_SIZE:
+                self._verified.popitem(last=False)
+        return True
+
+    def stats(self) -> dict:
+        """Throughput and latency counters for monitoring."""
+        with self._lock:
+            uptime = time.monotonic() - self._started_at
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "in_flight": self._pending,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "failed": self.failed,
+                "verify_cache_hits": self.cache_hits,
+                "verify_cache_entries": len(self._verified),
+                "per_second": round(self.completed / uptime, 3) if uptime else 0.0,
+                "wait_ms_p50": round(_percentile(self._waits, 0.5) * 1000, 1),
+                "wait_ms_p95": round(_percentile(self._waits, 0.95) * 1000, 1),
+                "run_ms_p50": round(_percentile(self._runs, 0.5) * 1000, 1),
+                "run_ms_p95": round(_percentile(self._runs, 0.95) * 1000, 1),
+            }
+
+    def shutdown(self):
+        """Stop the worker processes."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(cancel_futures=True)
+                self._pool = None
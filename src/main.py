@@ -9,10 +9,13 @@ Usage:
     python src/main.py list --category support --no-phone
     python src/main.py stats           # Show statistics
     python src/main.py export          # Export to JSON
+    python src/main.py export -f ndjson -o data/jobs.ndjson.gz
+    python src/main.py reindex         # Rebuild the search index and stats
+    python src/main.py archive         # Move expired jobs to the archive DB
 """
 
 import asyncio
-import json
+import gzip
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -25,8 +28,16 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.scrapers import RemoteOKScraper, WeWorkRemotelyScraper, IndeedScraper, RedditScraper, JobSpyScraper, WellfoundScraper
-from src.database import JobDatabase
+from src.scrapers import (
+    BaseScraper, FetchScheduler, HttpCache, RemoteOKScraper, WeWorkRemotelyScraper, IndeedScraper, RedditScraper, JobSpyScraper, WellfoundScraper,
+)
+from src.database import (
+    JobDatabase, parse_fields, ARCHIVE_CHUNK_SIZE, EXPIRY_GRACE_DAYS, LIST_COLUMNS, RETENTION_DAYS,
+)
+from src.archive import JobArchive
+from src.pipeline import StreamStats, finish_source, write_jobs, write_stream
+from src.scrapers.http_cache import HTTP_CACHE_PATH
+from src.export import iter_csv, iter_json_array, iter_ndjson
 
 console = Console()
 
@@ -51,70 +62,139 @@ def cli():
 @click.option('--source', '-s', type=click.Choice(list(SCRAPERS.keys())), 
               help='Scrape only this source')
 @click.option('--db', default='data/jobs.db', help='Database path')
-def scrape(source, db):
+@click.option('--grace-days', default=EXPIRY_GRACE_DAYS, show_default=True,
+              help='Deactivate jobs unseen by their source for this many days')
+@click.option('--retention-days', default=RETENTION_DAYS, show_default=True,
+              help='Purge inactive jobs older than this (0 disables)')
+@click.option('--concurrency', '-c', default=len(SCRAPERS), show_default=True,
+              help='Maximum number of sources scraped at once')
+@click.option('--http-cache', default=HTTP_CACHE_PATH, show_default=True,
+              help='Cache of fetched pages used to skip unchanged ones')
+@click.option('--no-http-cache', is_flag=True, help='Fetch and parse every page in full')
+def scrape(source, db, grace_days, retention_days, concurrency, http_cache, no_http_cache):
     """Run scrapers to fetch new jobs."""
-    asyncio.run(_scrape(source, db))
+    asyncio.run(_scrape(
+        source, db, grace_days, retention_days, concurrency,
+        None if no_http_cache else http_cache,
+    ))
 
 
-async def _scrape(source: str | None, db_path: str):
-    """Async scrape implementation."""
+async def _scrape(
+    source: str | None,
+    db_path: str,
+    grace_days: float = EXPIRY_GRACE_DAYS,
+    retention_days: float = RETENTION_DAYS,
+    concurrency: int = len(SCRAPERS),
+    http_cache_path: str | None = HTTP_CACHE_PATH,
+):
+    """
+    Async scrape implementation.
+    
+    Sources run concurrently (at most `concurrency` at once), each bounded
+    by its scraper's timeout, and each streams its pages into the database
+    as they are parsed, so a slow or failing source never holds back the rest.
+    """
     database = JobDatabase(db_path)
     
     sources_to_scrape = [source] if source else list(SCRAPERS.keys())
     
-    total_new = 0
-    total_updated = 0
-    total_found = 0
+    totals = {'found': 0, 'new': 0, 'updated': 0, 'expired': 0}
+    slots = asyncio.Semaphore(max(concurrency, 1))
+    # Shared so sources that hit the same host also share its politeness budget
+    # and its open connections
+    scheduler = FetchScheduler()
+    client = BaseScraper.create_client()
+    http_cache = HttpCache(http_cache_path) if http_cache_path else None
+    # One connection, so database writes from finished sources take turns
+    db_lock = asyncio.Lock()
     
-    for source_name in sources_to_scrape:
-        scraper_class = SCRAPERS[source_name]
-        scraper = scraper_class()
-        
-        console.print(f"\n[bold blue]Scraping {source_name}...[/bold blue]")
-        
-        log_id = database.log_scrape(source_name)
+    async def db_call(fn, *args):
+        async with db_lock:
+            return await asyncio.to_thread(fn, *args)
+    
+    async def scrape_source(source_name: str, progress: Progress, task):
+        scraper = SCRAPERS[source_name](scheduler=scheduler, client=client, http_cache=http_cache)
         
-        try:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-            ) as progress:
-                task = progress.add_task(f"Fetching from {source_name}...", total=None)
-                jobs = await scraper.scrape()
-                progress.update(task, description=f"Found {len(jobs)} jobs")
+        async with slots:
+            progress.update(task, description=f"Fetching from {source_name}...")
+            log_id = await db_call(database.log_scrape, source_name)
+            run_started = datetime.utcnow()
+            stats = StreamStats()
             
-            new_count = 0
-            updated_count = 0
+            async def write_batch(jobs: list) -> tuple[int, int]:
+                written = await db_call(write_jobs, database, [job.to_dict() for job in jobs])
+                progress.update(task, description=f"{source_name}: {stats.found} jobs streamed...")
+                return written
             
-            for job in jobs:
-                is_new, is_updated = database.upsert_job(job.to_dict())
-                if is_new:
-                    new_count += 1
-                elif is_updated:
-                    updated_count += 1
+            try:
+                await asyncio.wait_for(write_stream(scraper.stream(), write_batch, stats), scraper.timeout)
+                found, expired_count = await db_call(
+                    finish_source, database, source_name, log_id, stats, scraper.page_log,
+                    run_started, grace_days, http_cache,
+                )
+            except Exception as e:
+                error = f"timed out after {scraper.timeout:g}s" if isinstance(e, asyncio.TimeoutError) else str(e)
+                await db_call(database.finish_scrape, log_id, stats.found, stats.new, stats.updated, 'error', error)
+                progress.update(task, description=f"[red]✗[/red] {source_name}: Error: {error}", total=1, completed=1)
+                return
             
-            database.finish_scrape(
-                log_id, 
-                jobs_found=len(jobs),
-                jobs_new=new_count,
-                jobs_updated=updated_count
+            progress.update(
+                task,
+                description=f"[green]✓[/green] {source_name}: Found: {found}, "
+                            f"New: {stats.new}, Updated: {stats.updated}, Expired: {expired_count}, "
+                            f"Unchanged pages: {scraper.progress.pages_unchanged}",
+                total=1, completed=1,
             )
-            
-            console.print(f"  [green]✓[/green] Found: {len(jobs)}, New: {new_count}, Updated: {updated_count}")
-            
-            total_found += len(jobs)
-            total_new += new_count
-            total_updated += updated_count
-            
-        except Exception as e:
-            database.finish_scrape(log_id, 0, 0, 0, status='error', error=str(e))
-            console.print(f"  [red]✗[/red] Error: {e}")
+            totals['found'] += found
+            totals['new'] += stats.new
+            totals['updated'] += stats.updated
+            totals['expired'] += expired_count
+    
+    console.print(f"\n[bold blue]Scraping {', '.join(sources_to_scrape)}...[/bold blue]")
+    async with client:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+        ) as progress:
+            tasks = {
+                source_name: progress.add_task(f"{source_name}: queued", total=None)
+                for source_name in sources_to_scrape
+            }
+            await asyncio.gather(*(
+                scrape_source(source_name, progress, task) for source_name, task in tasks.items()
+            ))
+    
+    connections = client.stats
+    console.print(
+        f"\n  [dim]HTTP: {connections.requests} requests over {connections.connections_opened} connections "
+        f"({connections.reused} reused, {connections.http2_requests} over HTTP/2)[/dim]"
+    )
+    
+    for host, limits in scheduler.stats().items():
+        style = "yellow" if limits['throttled'] else "dim"
+        console.print(
+            f"  [{style}]{host}: {limits['requests']} requests, {limits['throttled']} throttled, "
+            f"{limits['retries']} retried, rate {limits['rate']}/{limits['base_rate']} req/s, "
+            f"waited {limits['waited_s']}s[/{style}]"
+        )
     
-    console.print(f"\n[bold green]Done![/bold green] Total: {total_found} jobs, {total_new} new, {total_updated} updated")
+    if http_cache is not None:
+        http_cache.close()
+    
+    purged = database.purge_inactive_jobs(retention_days) if retention_days > 0 else 0
+    
+    console.print(
+        f"\n[bold green]Done![/bold green] Total: {totals['found']} jobs, {totals['new']} new, "
+        f"{totals['updated']} updated, {totals['expired']} expired, {purged} purged"
+    )
     database.close()
 
 
+# Columns the `list` table renders
+LIST_TABLE_COLUMNS = ('id', 'title', 'company', 'category', 'salary_min', 'salary_max', 'is_no_phone', 'source')
+
+
 @cli.command('list')
 @click.option('--category', '-c', help='Filter by category (support, dev, etc.)')
 @click.option('--source', '-s', help='Filter by source')
@@ -131,7 +211,8 @@ def list_jobs(category, source, no_phone, has_salary, limit, db):
         source=source,
         no_phone_only=no_phone,
         has_salary=has_salary,
-        limit=limit
+        limit=limit,
+        columns=LIST_TABLE_COLUMNS
     )
     
     if not jobs:
@@ -222,45 +303,84 @@ def search(query, limit, db):
 
 
 @cli.command()
-@click.option('--format', '-f', type=click.Choice(['json', 'csv']), default='json')
+@click.option('--db', default='data/jobs.db', help='Database path')
+def reindex(db):
+    """Rebuild the full-text search index, stats counters and stored JSON from scratch."""
+    database = JobDatabase(db)
+    database.rebuild_search_index()
+    database.rebuild_stats()
+    database.rebuild_payloads()
+    console.print("[green]✓[/green] Search index, stats and job payloads rebuilt")
+    database.close()
+
+
+@cli.command()
+@click.option('--db', default='data/jobs.db', help='Database path')
+@click.option('--archive', 'archive_path', default='data/jobs_archive.db', help='Archive database path')
+@click.option('--older-than-days', default=0.0, show_default=True,
+              help='Only archive jobs inactive and unseen for this many days')
+@click.option('--chunk-size', default=ARCHIVE_CHUNK_SIZE, show_default=True,
+              help='Jobs moved per transaction')
+def archive(db, archive_path, older_than_days, chunk_size):
+    """Move expired jobs out of the live database into the archive."""
+    database = JobDatabase(db)
+    job_archive = JobArchive(archive_path)
+    
+    moved = database.archive_jobs(job_archive, older_than_days, chunk_size)
+    
+    console.print(f"[green]✓[/green] Archived {moved} jobs to {archive_path} ({job_archive.count()} total)")
+    job_archive.close()
+    database.close()
+
+
+@cli.command()
+@click.option('--format', '-f', type=click.Choice(['json', 'ndjson', 'csv']), default='json')
 @click.option('--output', '-o', default='data/export.json', help='Output file')
 @click.option('--category', '-c', help='Filter by category')
+@click.option('--source', '-s', help='Filter by source')
 @click.option('--no-phone', is_flag=True, help='Only no-phone jobs')
+@click.option('--fields', help='Comma-separated columns to export (default: all)')
+@click.option('--gzip', 'compress', is_flag=True, help='Gzip the output (implied by a .gz output name)')
 @click.option('--db', default='data/jobs.db', help='Database path')
-def export(format, output, category, no_phone, db):
-    """Export jobs to file."""
+def export(format, output, category, source, no_phone, fields, compress, db):
+    """Export all matching jobs to file, streamed in chunks."""
+    try:
+        columns = parse_fields(fields) or LIST_COLUMNS
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint='--fields')
     database = JobDatabase(db)
     
-    jobs = database.get_jobs(
-        category=category,
-        no_phone_only=no_phone,
-        limit=10000  # Get all
-    )
-    
     output_path = Path(output)
+    if compress and output_path.suffix != '.gz':
+        output_path = output_path.with_name(output_path.name + '.gz')
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    if format == 'json':
-        # Parse tags JSON string back to list
+    exported = 0
+    
+    def counted(jobs):
+        nonlocal exported
         for job in jobs:
-            if job.get('tags') and isinstance(job['tags'], str):
-                try:
-                    job['tags'] = json.loads(job['tags'])
-                except:
-                    job['tags'] = []
-        
-        with open(output_path, 'w') as f:
-            json.dump(jobs, f, indent=2, default=str)
-    
-    elif format == 'csv':
-        import csv
-        with open(output_path, 'w', newline='') as f:
-            if jobs:
-                writer = csv.DictWriter(f, fieldnames=jobs[0].keys())
-                writer.writeheader()
-                writer.writerows(jobs)
-    
-    console.print(f"[green]✓[/green] Exported {len(jobs)} jobs to {output_path}")
+            exported += 1
+            yield job
+    
+    jobs = counted(database.iter_jobs(
+        category=category,
+        source=source,
+        no_phone_only=no_phone,
+        with_description=True,
+        columns=columns
+    ))
+    serializer = {'json': iter_json_array, 'ndjson': iter_ndjson, 'csv': iter_csv}[format]
+    
+    if output_path.suffix == '.gz':
+        f = gzip.open(output_path, 'wt', newline='', encoding='utf-8')
+    else:
+        f = open(output_path, 'w', newline='', encoding='utf-8')
+    with f:
+        for chunk in serializer(jobs, columns + ('description',)):
+            f.write(chunk)
+    
+    console.print(f"[green]✓[/green] Exported {exported} jobs to {output_path}")
     database.close()
 
 
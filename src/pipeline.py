@@ -0,0 +1,130 @@
+"""Stream scraped pages through a bounded queue into a batching database writer."""
+
+import asyncio
+from contextlib import aclosing
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+from src.database import EXPIRY_GRACE_DAYS, JobDatabase
+from src.scrapers.http_cache import HttpCache, PageLog
+
+
+# Pages buffered between a scraper and the writer; the scraper waits when it is full
+PIPELINE_QUEUE_PAGES = 8
+
+# Rows per database write once pages queue up faster than they are written
+WRITE_BATCH_SIZE = 200
+
+
+@dataclass
+class StreamStats:
+    """Running totals of a streamed scrape, readable even if the scrape fails midway."""
+
+    found: int = 0
+    new: int = 0
+    updated: int = 0
+    batches: int = 0
+
+
+async def write_stream(
+    pages: AsyncIterator[list],
+    write_batch: Callable[[list], Awaitable[tuple[int, int]]],
+    stats: Optional[StreamStats] = None,
+    queue_pages: int = PIPELINE_QUEUE_PAGES,
+    batch_size: int = WRITE_BATCH_SIZE,
+) -> StreamStats:
+    """
+    Drain pages of jobs into write_batch (which returns (new, updated)).
+
+    The scraper runs ahead of the writer by at most queue_pages pages. The
+    writer flushes whenever the queue runs dry, so the first page lands as
+    soon as it is parsed, and merges queued pages into batches of up to
+    batch_size rows when the scraper is faster. If the scraper fails, rows
+    already written stay written and its error is raised after the writer
+    has drained the queue.
+    """
+    stats = stats or StreamStats()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=queue_pages)
+    done = object()
+
+    async def produce():
+        try:
+            async with aclosing(pages) as stream:
+                async for page in stream:
+                    if page:
+                        await queue.put(page)
+        finally:
+            if not asyncio.current_task().cancelling():
+                await queue.put(done)
+
+    producer = asyncio.create_task(produce())
+    try:
+        batch = []
+        while True:
+            page = await queue.get()
+            if page is not done:
+                batch.extend(page)
+                stats.found += len(page)
+            if batch and (page is done or queue.empty() or len(batch) >= batch_size):
+                new_count, updated_count = await write_batch(batch)
+                stats.new += new_count
+                stats.updated += updated_count
+                stats.batches += 1
+                batch = []
+            if page is done:
+                break
+        await producer
+        return stats
+    finally:
+        if not producer.done():
+            # Let the scraper's cleanup (closing clients, stopping workers) finish
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+
+
+def write_jobs(db: JobDatabase, jobs: list[dict]) -> tuple[int, int]:
+    """Upsert one streamed batch of job dicts, letting readers see it straight away."""
+    new_count, updated_count = db.bulk_upsert_jobs(jobs)
+    if new_count or updated_count:
+        db.bump_data_version()
+    return new_count, updated_count
+
+
+def finish_source(
+    db: JobDatabase,
+    source_name: str,
+    log_id: int,
+    stats: StreamStats,
+    page_log: PageLog,
+    run_started: datetime,
+    grace_days: float = EXPIRY_GRACE_DAYS,
+    http_cache: Optional[HttpCache] = None,
+) -> tuple[int, int]:
+    """
+    Finish a source whose pages have all been written: mark the jobs on its
+    unchanged pages as seen, expire its stale listings, close its log entry
+    and only then commit its pages to the HTTP cache. Unchanged pages whose
+    jobs are no longer in the database are dropped from the cache instead,
+    so the next scrape saves them again. Returns (jobs found, expired).
+    """
+    unchanged_ids = page_log.unchanged_ids()
+    touched = db.touch_jobs(unchanged_ids)
+    missing_ids = db.missing_job_ids(unchanged_ids) if touched < len(unchanged_ids) else set()
+    found = stats.found + touched
+
+    # An empty result usually means the source broke, not that every listing expired
+    expired_count = 0
+    if found:
+        expired_count = db.expire_stale_jobs(source_name, run_started, grace_days)
+
+    db.finish_scrape(
+        log_id,
+        jobs_found=found,
+        jobs_new=stats.new,
+        jobs_updated=stats.updated,
+        jobs_expired=expired_count,
+    )
+    if http_cache is not None:
+        http_cache.commit(page_log, missing_ids)
+    return found, expired_count
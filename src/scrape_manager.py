@@ -0,0 +1,160 @@
+"""Background scrape runs for the API: dedup, concurrency cap, progress, cancellation."""
+
+import asyncio
+import uuid
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Awaitable, Callable, Optional
+
+from src.scrapers.base import ScrapeProgress
+
+
+# Finished runs kept for /api/scrape/status
+RUN_HISTORY = 20
+
+
+@dataclass
+class SourceRun:
+    """One source inside a scrape run."""
+
+    status: str = "queued"  # queued, running, done, error, cancelled
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    error: Optional[str] = None
+    progress: ScrapeProgress = field(default_factory=ScrapeProgress)
+
+
+@dataclass
+class ScrapeRun:
+    """A set of sources scraped as one background task."""
+
+    id: str
+    sources: dict[str, SourceRun]
+    status: str = "queued"  # queued, running, done, cancelled
+    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    finished_at: Optional[str] = None
+    task: Optional[asyncio.Task] = field(default=None, repr=False)
+
+    @property
+    def active(self) -> bool:
+        return self.status in ("queued", "running")
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "status": self.status,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+            "sources": {name: asdict(source) for name, source in self.sources.items()},
+        }
+
+
+# Coroutine that scrapes and persists one source, updating its SourceRun
+SourceRunner = Callable[[str, SourceRun], Awaitable[None]]
+
+
+class ScrapeManager:
+    """
+    Owns every background scrape started through the API.
+
+    A source that is already queued or running in another run is not
+    scraped twice; submit() reports which run already covers it. A run's
+    sources are scraped concurrently, at most max_concurrent at once across
+    all runs. Task handles are held until their run finishes, so a run can
+    never be garbage-collected mid-flight, and cancel() can stop it.
+    """
+
+    def __init__(
+        self,
+        run_source: SourceRunner,
+        max_concurrent: int = 2,
+        after_run: Optional[Callable[[ScrapeRun], Awaitable[None]]] = None,
+    ):
+        self.run_source = run_source
+        self.after_run = after_run
+        self.max_concurrent = max_concurrent
+        self._slots = asyncio.Semaphore(max_concurrent)
+        self._runs: OrderedDict[str, ScrapeRun] = OrderedDict()
+
+    def submit(self, sources: list[str]) -> tuple[Optional[ScrapeRun], dict[str, str]]:
+        """
+        Start a run for the given sources, skipping any already in flight.
+        Returns (new run or None if every source was in flight, {source: covering run id}).
+        """
+        in_flight = {
+            name: run.id
+            for run in self._runs.values() if run.active
+            for name, source in run.sources.items() if source.status in ("queued", "running")
+        }
+        coalesced = {name: in_flight[name] for name in sources if name in in_flight}
+        fresh = [name for name in sources if name not in in_flight]
+        if not fresh:
+            return None, coalesced
+
+        run = ScrapeRun(id=uuid.uuid4().hex[:12], sources={name: SourceRun() for name in fresh})
+        run.task = asyncio.create_task(self._execute(run), name=f"scrape-{run.id}")
+        self._runs[run.id] = run
+        self._trim_history()
+        return run, coalesced
+
+    async def _execute(self, run: ScrapeRun):
+        run.status = "running"
+        try:
+            # Sources run side by side; a slow or failing one only holds its own slot
+            await asyncio.gather(*(
+                self._execute_source(name, source) for name, source in run.sources.items()
+            ))
+            run.status = "done"
+            if self.after_run:
+                await self.after_run(run)
+        except asyncio.CancelledError:
+            run.status = "cancelled"
+            for source in run.sources.values():
+                if source.status == "queued":
+                    source.status = "cancelled"
+        finally:
+            run.finished_at = datetime.utcnow().isoformat()
+            run.task = None
+
+    async def _execute_source(self, name: str, source: SourceRun):
+        async with self._slots:
+            source.status = "running"
+            source.started_at = datetime.utcnow().isoformat()
+            try:
+                await self.run_source(name, source)
+                source.status = "done"
+            except asyncio.CancelledError:
+                source.status = "cancelled"
+                raise
+            except Exception as e:
+                source.status = "error"
+                source.error = str(e) or type(e).__name__
+            finally:
+                source.finished_at = datetime.utcnow().isoformat()
+
+    def cancel(self, run_id: str) -> Optional[ScrapeRun]:
+        """Cancel a queued or running run. Returns it, or None if unknown."""
+        run = self._runs.get(run_id)
+        if run is not None and run.task is not None:
+            run.task.cancel()
+        return run
+
+    def get(self, run_id: str) -> Optional[ScrapeRun]:
+        return self._runs.get(run_id)
+
+    def runs(self) -> list[dict]:
+        """All retained runs, newest first."""
+        return [run.to_dict() for run in reversed(self._runs.values())]
+
+    def _trim_history(self):
+        finished = [run_id for run_id, run in self._runs.items() if not run.active]
+        for run_id in finished[:max(len(finished) - RUN_HISTORY, 0)]:
+            del self._runs[run_id]
+
+    async def shutdown(self):
+        """Cancel every active run and wait for them to unwind."""
+        tasks = [run.task for run in self._runs.values() if run.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
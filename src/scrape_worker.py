@@ -0,0 +1,106 @@
+"""Run one source's scraper in a separate process, streaming progress and jobs back to the API."""
+
+import asyncio
+import multiprocessing
+from multiprocessing.connection import Connection
+from typing import AsyncIterator
+
+from src.scrapers import (
+    HttpCache, JobSpyScraper, PageLog, RedditScraper, RemoteOKScraper, ScrapeProgress, WellfoundScraper, WeWorkRemotelyScraper,
+)
+
+
+# Seconds a cancelled worker gets to exit before it is killed
+TERMINATE_GRACE = 5.0
+
+SCRAPERS = {
+    'remoteok': RemoteOKScraper,
+    'weworkremotely': WeWorkRemotelyScraper,
+    'reddit': RedditScraper,
+    'jobspy': JobSpyScraper,
+    'wellfound': WellfoundScraper,
+}
+
+
+class _PipeProgress(ScrapeProgress):
+    """ScrapeProgress that forwards every counter update to the parent process."""
+
+    def __init__(self, conn: Connection):
+        object.__setattr__(self, '_conn', conn)
+        super().__init__()
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        self._conn.send(("progress", name, value))
+
+
+async def _stream_pages(scraper, conn: Connection):
+    async for page in scraper.stream():
+        conn.send(("page", [job.to_dict() for job in page]))
+    conn.send(("done", scraper.page_log))
+
+
+def _worker_main(source_name: str, conn: Connection):
+    """Child process entry point: stream the jobs page by page (or the error), then exit."""
+    http_cache = None
+    try:
+        http_cache = HttpCache()
+        scraper = SCRAPERS[source_name](progress=_PipeProgress(conn), http_cache=http_cache)
+        asyncio.run(_stream_pages(scraper, conn))
+    except Exception as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+    finally:
+        if http_cache is not None:
+            http_cache.close()
+        conn.close()
+
+
+async def stream_in_worker(
+    source_name: str, progress: ScrapeProgress, page_log: PageLog
+) -> AsyncIterator[list[dict]]:
+    """
+    Scrape a source in a fresh spawned process, yielding its jobs as
+    Job.to_dict() payloads a page at a time. Once the stream ends,
+    `page_log` holds the worker's PageLog, for committing to the HTTP
+    cache after the jobs are saved (see BaseScraper.fetch_page).
+
+    Fetching and HTML parsing never touch the caller's event loop; the
+    worker's progress counters are mirrored onto `progress` as they change.
+    A caller that stops reading only lets the worker run ahead by what the
+    pipe buffers. Closing the stream early, or cancelling the task reading
+    it, terminates the worker.
+    Raises RuntimeError if the scraper failed or the worker died.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    receiver, sender = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=_worker_main, args=(source_name, sender), name=f"scrape-{source_name}", daemon=True)
+    process.start()
+    sender.close()
+
+    finished = False
+    try:
+        while True:
+            try:
+                message = await asyncio.to_thread(receiver.recv)
+            except EOFError:
+                await asyncio.to_thread(process.join, TERMINATE_GRACE)
+                raise RuntimeError(f"Scrape worker for {source_name} exited with code {process.exitcode}")
+            kind = message[0]
+            if kind == "progress":
+                setattr(progress, message[1], message[2])
+            elif kind == "page":
+                yield message[1]
+            elif kind == "done":
+                page_log.merge(message[1])
+                finished = True
+                return
+            else:
+                raise RuntimeError(message[1])
+    finally:
+        if not finished:
+            process.terminate()
+        await asyncio.to_thread(process.join, TERMINATE_GRACE)
+        if process.is_alive():
+            process.kill()
+        receiver.close()
+
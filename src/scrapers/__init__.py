@@ -1,4 +1,5 @@
-from .base import BaseScraper, Job
+from .base import BaseScraper, FetchScheduler, Job, ScrapeProgress, ScraperClient
+from .http_cache import HttpCache, PageLog
 from .remoteok import RemoteOKScraper
 from .weworkremotely import WeWorkRemotelyScraper
 from .indeed import IndeedScraper
@@ -9,6 +10,7 @@ from .wellfound import WellfoundScraper
 __all__ = [
     'BaseScraper', 
     'Job',
+    'ScrapeProgress',
     'RemoteOKScraper', 
     'WeWorkRemotelyScraper',
     'IndeedScraper',
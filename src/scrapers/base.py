@@ -1,11 +1,26 @@
 """Base scraper class for all job sources."""
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime
-from typing import Optional
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Optional, TypeVar
+from urllib.parse import urlsplit
+import asyncio
 import hashlib
 import json
+import time
+
+import httpx
+
+from .http_cache import CacheEntry, HttpCache, PageLog, body_hash
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 
 @dataclass
@@ -62,20 +77,445 @@ class Job:
         }
 
 
+@dataclass
+class ScrapeProgress:
+    """Live counters for one source's scrape, updated as it runs."""
+    
+    pages_fetched: int = 0
+    jobs_parsed: int = 0
+    rows_written: int = 0
+    # Pages the HTTP cache showed unchanged, so they were not parsed again
+    pages_unchanged: int = 0
+    # Host limiter state by host, see HostLimiter.stats()
+    rate_limits: dict = field(default_factory=dict)
+    # HTTP connection reuse, see ConnectionStats
+    connections: dict = field(default_factory=dict)
+
+
+# Pool settings shared by every scraper's client
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+HTTP_MAX_CONNECTIONS = 20
+HTTP_MAX_KEEPALIVE = 10
+HTTP_KEEPALIVE_EXPIRY = 30.0
+DEFAULT_HEADERS = {
+    'User-Agent': 'RemoteJobScraper/1.0 (https://github.com/jaume/remote-job-scraper)',
+    'Accept-Language': 'en-US,en;q=0.8',
+}
+
+
+@dataclass
+class ConnectionStats:
+    """Request and connection counts for one pooled client, from httpcore trace events."""
+    
+    requests: int = 0
+    connections_opened: int = 0
+    tls_handshakes: int = 0
+    http2_requests: int = 0
+    
+    @property
+    def reused(self) -> int:
+        """Requests sent over an already-open connection."""
+        return max(self.requests - self.connections_opened, 0)
+    
+    async def trace(self, event_name: str, info: dict):
+        if event_name == "connection.connect_tcp.started":
+            self.connections_opened += 1
+        elif event_name == "connection.start_tls.started":
+            self.tls_handshakes += 1
+        elif event_name == "http11.send_request_headers.started":
+            self.requests += 1
+        elif event_name == "http2.send_request_headers.started":
+            self.requests += 1
+            self.http2_requests += 1
+    
+    def to_dict(self) -> dict:
+        return {**asdict(self), 'reused': self.reused}
+
+
+class ScraperClient(httpx.AsyncClient):
+    """
+    The pooled HTTP client a scrape run shares across its scrapers.
+    
+    Keeps connections alive between requests and sources, speaks HTTP/2
+    when h2 is installed, and counts connection reuse in `stats`.
+    """
+    
+    def __init__(
+        self,
+        max_connections: int = HTTP_MAX_CONNECTIONS,
+        max_keepalive: int = HTTP_MAX_KEEPALIVE,
+        timeout: httpx.Timeout = HTTP_TIMEOUT,
+        http2: bool = HTTP2_AVAILABLE,
+        **kwargs,
+    ):
+        kwargs.setdefault('headers', DEFAULT_HEADERS)
+        kwargs.setdefault('follow_redirects', True)
+        super().__init__(
+            http2=http2,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+            ),
+            **kwargs,
+        )
+        self.stats = ConnectionStats()
+    
+    async def send(self, request: httpx.Request, **kwargs) -> httpx.Response:
+        request.extensions["trace"] = self.stats.trace
+        return await super().send(request, **kwargs)
+
+
+# Statuses that mean "slow down": back off, then retry
+THROTTLE_STATUSES = frozenset({429, 503})
+MAX_RETRIES = 3
+
+# Exponential backoff when the host gives no Retry-After
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 60.0
+
+# Rate changes: halve on throttling (down to MIN_RATE), regain 25% per success
+MIN_RATE = 0.05
+RECOVERY_FACTOR = 1.25
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Seconds the server asked us to wait (Retry-After as delay or HTTP date), if any."""
+    value = response.headers.get('retry-after')
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class HostLimiter:
+    """
+    Adaptive token bucket for one host.
+    
+    Starts at the configured rate, halves it and pauses the host on 429/503
+    (for Retry-After, or an exponential backoff), follows X-Ratelimit-*
+    budgets when the host sends them, and climbs back to the configured
+    rate as requests succeed again.
+    """
+    
+    def __init__(self, max_concurrent: int, requests_per_second: float):
+        self.slots = asyncio.Semaphore(max_concurrent)
+        self.base_rate = requests_per_second
+        self.rate = requests_per_second
+        self.tokens = 1.0
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.failures = 0
+        # Rate allowed by the host's last X-Ratelimit budget, until its window resets
+        self.budget_rate = requests_per_second
+        self.budget_until = 0.0
+        
+        self.requests = 0
+        self.throttled = 0
+        self.retries = 0
+        self.waited = 0.0
+    
+    async def acquire(self):
+        """Wait until the bucket allows one more request."""
+        now = time.monotonic()
+        if self.rate > 0:
+            self.tokens = min(1.0, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens < 0:
+                await self._sleep(-self.tokens / self.rate)
+        
+        # A throttle seen while we waited for a token pauses us too
+        while (pause := self.blocked_until - time.monotonic()) > 0:
+            await self._sleep(pause)
+        self.requests += 1
+    
+    async def _sleep(self, seconds: float):
+        self.waited += seconds
+        await asyncio.sleep(seconds)
+    
+    def observe(self, response: httpx.Response) -> Optional[float]:
+        """
+        Adapt to a response. Returns the backoff delay if the host throttled
+        us, else None.
+        """
+        now = time.monotonic()
+        budgeted = self._follow_budget(response, now)
+        
+        if response.status_code not in THROTTLE_STATUSES:
+            self.failures = 0
+            # A response carrying a budget already set the rate the host allows
+            ceiling = self.base_rate
+            if now < self.budget_until:
+                ceiling = min(ceiling, self.budget_rate)
+            if not budgeted and self.rate < ceiling:
+                self.rate = min(ceiling, self.rate * RECOVERY_FACTOR)
+            return None
+        
+        self.throttled += 1
+        self.failures += 1
+        self.rate = max(self.rate / 2, MIN_RATE)
+        delay = _retry_after(response)
+        if delay is None:
+            delay = min(BACKOFF_BASE * 2 ** (self.failures - 1), BACKOFF_MAX)
+        self.blocked_until = max(self.blocked_until, now + delay)
+        self.tokens = min(self.tokens, 0.0)
+        return delay
+    
+    def _follow_budget(self, response: httpx.Response, now: float) -> bool:
+        """
+        Spread what is left of an X-Ratelimit-Remaining/Reset window over the
+        window. Returns whether the response carried such a budget.
+        """
+        try:
+            remaining = float(response.headers['x-ratelimit-remaining'])
+            reset = float(response.headers['x-ratelimit-reset'])
+        except (KeyError, ValueError):
+            return False
+        if reset > 1e9:
+            # Some hosts send the reset as an epoch timestamp
+            reset = reset - time.time()
+        reset = max(reset, 1.0)
+        if remaining < 1:
+            self.blocked_until = max(self.blocked_until, now + reset)
+        else:
+            self.budget_rate = remaining / reset
+            self.budget_until = now + reset
+            self.rate = min(self.rate, self.budget_rate)
+        return True
+    
+    def stats(self) -> dict:
+        return {
+            'rate': round(self.rate, 3),
+            'base_rate': self.base_rate,
+            'requests': self.requests,
+            'throttled': self.throttled,
+            'retries': self.retries,
+            'waited_s': round(self.waited, 2),
+            'blocked_for_s': round(max(self.blocked_until - time.monotonic(), 0.0), 2),
+        }
+
+
+class FetchScheduler:
+    """
+    Runs a scrape's requests concurrently while staying polite to each host.
+    
+    Every host gets at most `max_concurrent` requests in flight and an
+    adaptive HostLimiter starting at `requests_per_second`. Limits are fixed
+    by the first request to a host. One scheduler can be shared by several
+    scrapers, so sources that hit the same host share its budget.
+    """
+    
+    def __init__(self):
+        self._hosts: dict[str, HostLimiter] = {}
+    
+    def limiter(self, host: str, max_concurrent: int, requests_per_second: float) -> HostLimiter:
+        limiter = self._hosts.get(host)
+        if limiter is None:
+            limiter = self._hosts[host] = HostLimiter(max_concurrent, requests_per_second)
+        return limiter
+    
+    @asynccontextmanager
+    async def slot(self, host: str, max_concurrent: int, requests_per_second: float) -> AsyncIterator[HostLimiter]:
+        """Hold one of host's request slots, waiting for its turn in the rate budget."""
+        limiter = self.limiter(host, max_concurrent, requests_per_second)
+        async with limiter.slots:
+            await limiter.acquire()
+            yield limiter
+    
+    async def request(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        url: str,
+        max_concurrent: int,
+        requests_per_second: float,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Send one request through url's host slot, retrying up to MAX_RETRIES
+        times when the host throttles. Returns the last response.
+        """
+        host = urlsplit(url).netloc
+        for attempt in range(MAX_RETRIES + 1):
+            async with self.slot(host, max_concurrent, requests_per_second) as limiter:
+                response = await client.request(method, url, **kwargs)
+                delay = limiter.observe(response)
+            # A Retry-After beyond BACKOFF_MAX is honored by later requests, not waited out here
+            if delay is None or delay > BACKOFF_MAX or attempt == MAX_RETRIES:
+                return response
+            limiter.retries += 1
+        return response
+    
+    def stats(self, host: Optional[str] = None) -> dict:
+        """Limiter state for one host, or for every host by name."""
+        if host is not None:
+            limiter = self._hosts.get(host)
+            return limiter.stats() if limiter else {}
+        return {name: limiter.stats() for name, limiter in self._hosts.items()}
+
+
+K = TypeVar('K')
+T = TypeVar('T')
+
+
 class BaseScraper(ABC):
     """Abstract base class for job scrapers."""
     
     name: str = "base"
     base_url: str = ""
     
-    def __init__(self):
+    # Seconds a whole scrape of this source may take before it is abandoned
+    timeout: float = 300.0
+    
+    # Politeness towards this source's host; the limiter adapts from here
+    max_per_host: int = 4
+    requests_per_second: float = 2.0
+    
+    def __init__(
+        self,
+        progress: Optional[ScrapeProgress] = None,
+        scheduler: Optional[FetchScheduler] = None,
+        client: Optional[ScraperClient] = None,
+        http_cache: Optional[HttpCache] = None,
+    ):
         self.jobs: list[Job] = []
+        # Pages parsed or found unchanged, for the HTTP cache once their jobs are saved
+        self.page_log = PageLog()
+        self.progress = progress or ScrapeProgress()
+        self.scheduler = scheduler or FetchScheduler()
+        self.client = client
+        self.http_cache = http_cache
+    
+    @staticmethod
+    def create_client(**options) -> ScraperClient:
+        """A pooled client to share across a scrape run; options tune ScraperClient."""
+        return ScraperClient(**options)
+    
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[ScraperClient]:
+        """
+        The client to scrape with: the injected shared one, or else a
+        client of this scraper's own that is closed afterwards (its
+        connection stats then land on the progress counters).
+        """
+        if self.client is not None:
+            yield self.client
+            return
+        async with self.create_client() as client:
+            try:
+                yield client
+            finally:
+                self.progress.connections = client.stats.to_dict()
+    
+    async def fetch(self, client: httpx.AsyncClient, url: str, **kwargs) -> httpx.Response:
+        """GET a page through the fetch scheduler, within this source's politeness limits."""
+        try:
+            return await self.scheduler.request(
+                client, "GET", url, self.max_per_host, self.requests_per_second, **kwargs
+            )
+        finally:
+            self.report_limits(urlsplit(url).netloc)
+    
+    async def fetch_page(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        parse: Callable[[httpx.Response], list[Job]],
+        **kwargs,
+    ) -> list[Job]:
+        """
+        Fetch a page and parse it into jobs, revalidating it against the HTTP cache.
+        
+        A page the server reports unchanged (304), or that comes back
+        byte-identical, is not parsed again: the ids of the jobs it held are
+        logged as unchanged and no jobs are returned for it. Nothing is
+        written to the cache here; the caller commits self.page_log once the
+        jobs are saved, so a failed write never hides a page's jobs.
+        """
+        if self.http_cache is None:
+            return parse(await self.fetch(client, url, **kwargs))
+        
+        key = self.http_cache.key(url, kwargs.get('params'))
+        entry = await asyncio.to_thread(self.http_cache.get, key)
+        if entry is not None:
+            kwargs['headers'] = {**(kwargs.get('headers') or {}), **entry.validators()}
+        response = await self.fetch(client, url, **kwargs)
+        
+        if entry is not None and response.status_code in (200, 304):
+            if response.status_code == 304 or body_hash(response.content) == entry.body_hash:
+                if entry.job_ids is not None:
+                    await asyncio.to_thread(self.http_cache.revalidated, key, response)
+                    self.page_log.unchanged[key] = entry.job_ids
+                    self.progress.pages_fetched += 1
+                    self.progress.pages_unchanged += 1
+                    return []
+                if response.status_code == 304:
+                    # Parse the stored copy; its validators still hold
+                    jobs = parse(httpx.Response(200, content=entry.content(), request=response.request))
+                    self.page_log.parsed[key] = replace(entry, job_ids=[job.id for job in jobs])
+                    return jobs
+        
+        jobs = parse(response)
+        if response.status_code == 200:
+            self.page_log.parsed[key] = CacheEntry.from_response(response, [job.id for job in jobs])
+        return jobs
+    
+    def report_limits(self, host: str):
+        """Publish a host's limiter state on the progress counters."""
+        # Reassigned rather than mutated so worker progress forwarding sees it
+        self.progress.rate_limits = {**self.progress.rate_limits, host: self.scheduler.stats(host)}
     
     @abstractmethod
-    async def scrape(self) -> list[Job]:
-        """Scrape jobs from source. Must be implemented by subclasses."""
+    def stream(self) -> AsyncIterator[list[Job]]:
+        """
+        Yield the source's jobs a page at a time, as each page is fetched
+        and parsed. Must be implemented by subclasses (as an async generator).
+        """
         pass
     
+    async def scrape(self) -> list[Job]:
+        """Scrape every job from the source in one list."""
+        jobs = []
+        async for page in self.stream():
+            jobs.extend(page)
+        self.jobs = jobs
+        return jobs
+    
+    async def iter_pages(
+        self, fetches: Iterable[tuple[K, Awaitable[T]]]
+    ) -> AsyncIterator[tuple[K, T | Exception]]:
+        """
+        Run (key, fetch) pairs concurrently, at most max_per_host at a time,
+        yielding (key, result) as each finishes; a failed fetch yields its
+        exception. No new fetch starts while the caller holds a result, so
+        a slow consumer bounds how many fetched pages sit in memory.
+        """
+        fetches = iter(fetches)
+        running: dict[asyncio.Future, K] = {}
+        try:
+            while True:
+                for key, fetch in fetches:
+                    running[asyncio.ensure_future(fetch)] = key
+                    if len(running) >= self.max_per_host:
+                        break
+                if not running:
+                    return
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    key = running.pop(task)
+                    yield key, task.exception() or task.result()
+        finally:
+            for task in running:
+                task.cancel()
+    
     def detect_no_phone(self, job: Job) -> bool:
         """Detect if job is likely no-phone based on title/description."""
         no_phone_keywords = [
@@ -0,0 +1,194 @@
+"""On-disk HTTP cache for scraper fetches: validators, compressed bodies and the jobs each page held."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional
+
+import httpx
+
+
+HTTP_CACHE_PATH = "data/http_cache.db"
+
+# Compressed bytes kept on disk before the least recently used pages are evicted
+HTTP_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def body_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+@dataclass
+class CacheEntry:
+    """What the last successful fetch of a page returned."""
+
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body_hash: str
+    body: bytes
+    job_ids: Optional[list[str]]
+
+    @classmethod
+    def from_response(cls, response: httpx.Response, job_ids: Optional[list[str]]) -> "CacheEntry":
+        return cls(
+            str(response.url),
+            response.headers.get('etag'),
+            response.headers.get('last-modified'),
+            body_hash(response.content),
+            zlib.compress(response.content, 6),
+            job_ids,
+        )
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for revalidating this page."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def content(self) -> bytes:
+        return zlib.decompress(self.body)
+
+
+@dataclass
+class PageLog:
+    """
+    What a scrape learned about its pages, kept aside until the jobs parsed
+    from them are saved (see HttpCache.commit).
+    """
+
+    # Cache key -> fresh entry for each page parsed this run
+    parsed: dict[str, CacheEntry] = field(default_factory=dict)
+    # Cache key -> ids of the jobs on each page found unchanged since the last run
+    unchanged: dict[str, list[str]] = field(default_factory=dict)
+
+    def unchanged_ids(self) -> list[str]:
+        return list(dict.fromkeys(job_id for ids in self.unchanged.values() for job_id in ids))
+
+    def merge(self, other: "PageLog"):
+        self.parsed.update(other.parsed)
+        self.unchanged.update(other.unchanged)
+
+
+class HttpCache:
+    """
+    SQLite file of previously fetched pages, keyed by URL and query params.
+
+    Each page keeps its ETag/Last-Modified, a hash and zlib-compressed copy
+    of its body, and the ids of the jobs parsed from it, so a scraper can
+    tell an unchanged page (304, or the same body again) from a changed one
+    without parsing it. Once the stored bodies exceed max_bytes the least
+    recently used pages are evicted. Safe to share between threads and,
+    through SQLite locking, between scrape worker processes.
+    """
+
+    def __init__(self, db_path: str = HTTP_CACHE_PATH, max_bytes: int = HTTP_CACHE_MAX_BYTES):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30.0)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS http_cache (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                body_hash TEXT NOT NULL,
+                body BLOB NOT NULL,
+                job_ids TEXT,
+                size INTEGER NOT NULL,
+                used_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_http_cache_used ON http_cache(used_at);
+        """)
+        self.conn.commit()
+
+    @staticmethod
+    def key(url: str, params: Optional[dict] = None) -> str:
+        return body_hash(str(httpx.URL(url, params=params)).encode())
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self.conn.execute("""
+                SELECT url, etag, last_modified, body_hash, body, job_ids FROM http_cache WHERE key = ?
+            """, (key,)).fetchone()
+        if row is None:
+            return None
+        url, etag, last_modified, stored_hash, body, job_ids = row
+        return CacheEntry(
+            url, etag, last_modified, stored_hash, body,
+            json.loads(job_ids) if job_ids is not None else None,
+        )
+
+    def commit(self, pages: PageLog, missing_ids: Iterable[str] = ()):
+        """
+        Record a scrape's pages once the jobs parsed from them are saved.
+        Unchanged pages holding any of missing_ids (jobs no longer in the
+        database) are dropped, so the next scrape parses them in full.
+        """
+        missing_ids = set(missing_ids)
+        stale = [
+            (key,) for key, job_ids in pages.unchanged.items()
+            if missing_ids.intersection(job_ids)
+        ]
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.executemany("DELETE FROM http_cache WHERE key = ?", stale)
+            self.conn.executemany("""
+                INSERT OR REPLACE INTO http_cache
+                    (key, url, etag, last_modified, body_hash, body, job_ids, size, used_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (
+                    key, entry.url, entry.etag, entry.last_modified, entry.body_hash, entry.body,
+                    json.dumps(entry.job_ids) if entry.job_ids is not None else None,
+                    len(entry.body), now,
+                )
+                for key, entry in pages.parsed.items()
+            ])
+            self._evict()
+
+    def revalidated(self, key: str, response: httpx.Response):
+        """Mark a page as confirmed unchanged, taking any fresh validators from the response."""
+        with self._lock, self.conn:
+            self.conn.execute("""
+                UPDATE http_cache SET
+                    etag = COALESCE(?, etag),
+                    last_modified = COALESCE(?, last_modified),
+                    used_at = ?
+                WHERE key = ?
+            """, (response.headers.get('etag'), response.headers.get('last-modified'), time.time(), key))
+
+    def _evict(self):
+        """Drop least recently used pages until the stored bodies fit in max_bytes."""
+        excess = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache").fetchone()[0] - self.max_bytes
+        if excess <= 0:
+            return
+        doomed = []
+        for key, size in self.conn.execute("SELECT key, size FROM http_cache ORDER BY used_at"):
+            doomed.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self.conn.executemany("DELETE FROM http_cache WHERE key = ?", doomed)
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries, size = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM http_cache"
+            ).fetchone()
+        return {'entries': entries, 'bytes': size, 'max_bytes': self.max_bytes}
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
@@ -3,7 +3,7 @@
 import httpx
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import AsyncIterator, Optional
 import re
 import json
 from urllib.parse import urlencode
@@ -30,33 +30,32 @@ class IndeedScraper(BaseScraper):
         {"q": "remote virtual assistant", "remotejob": "032b3046-06a3-4876-8dfd-474eb5e7ed11"},
     ]
     
-    async def scrape(self) -> list[Job]:
-        """Scrape jobs from Indeed."""
-        jobs = []
+    # Be nice to Indeed: replaces the fixed two-second pause between searches
+    max_per_host = 1
+    requests_per_second = 0.5
+    
+    async def stream(self) -> AsyncIterator[list[Job]]:
+        """Yield jobs from Indeed one search at a time."""
         seen_ids = set()
         
-        async with httpx.AsyncClient() as client:
-            for search in self.searches:
-                try:
-                    search_jobs = await self._search_jobs(client, search)
-                    
-                    for job in search_jobs:
-                        if job.source_id not in seen_ids:
-                            job.category = self.categorize(job)
-                            job.is_no_phone = self.detect_no_phone(job)
-                            jobs.append(job)
-                            seen_ids.add(job.source_id)
-                    
-                    # Rate limiting - be nice to Indeed
-                    import asyncio
-                    await asyncio.sleep(2)
-                    
-                except Exception as e:
-                    print(f"Error searching Indeed for '{search.get('q')}': {e}")
+        async with self.session() as client:
+            pages = self.iter_pages(
+                (search['q'], self._search_jobs(client, search)) for search in self.searches
+            )
+            async for query, search_jobs in pages:
+                if isinstance(search_jobs, Exception):
+                    print(f"Error searching Indeed for '{query}': {search_jobs}")
                     continue
-        
-        self.jobs = jobs
-        return jobs
+                
+                jobs = []
+                for job in search_jobs:
+                    if job.source_id not in seen_ids:
+                        job.category = self.categorize(job)
+                        job.is_no_phone = self.detect_no_phone(job)
+                        jobs.append(job)
+                        seen_ids.add(job.source_id)
+                self.progress.jobs_parsed += len(jobs)
+                yield jobs
     
     async def _search_jobs(self, client: httpx.AsyncClient, search: dict, max_pages: int = 2) -> list[Job]:
         """Search Indeed and parse results."""
@@ -74,19 +73,19 @@ class IndeedScraper(BaseScraper):
                 
                 url = f"{self.base_url}/jobs?" + urlencode(params)
                 
-                response = await client.get(
+                response = await self.fetch(
+                    client,
                     url,
                     headers={
                         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
                         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
                         'Accept-Language': 'en-US,en;q=0.5',
                     },
-                    timeout=30.0,
-                    follow_redirects=True
                 )
                 
                 if response.status_code != 200:
                     break
+                self.progress.pages_fetched += 1
                 
                 page_jobs = self._parse_search_results(response.text)
                 jobs.extend(page_jobs)
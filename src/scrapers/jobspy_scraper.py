@@ -6,8 +6,10 @@ https://github.com/speedyapply/JobSpy
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, Callable, Optional
+import asyncio
 import hashlib
+import threading
 from .base import BaseScraper, Job
 
 try:
@@ -17,6 +19,41 @@ except ImportError:
     JOBSPY_AVAILABLE = False
 
 
+def _run_in_daemon_thread(fn: Callable, **kwargs) -> asyncio.Future:
+    """
+    Run a blocking call on its own daemon thread and return a future for it.
+    
+    asyncio.to_thread would run it on the default executor, which
+    asyncio.run joins at shutdown, so a search abandoned by a timeout
+    would still hold up exit until it returned. Cancelling the returned
+    future abandons the thread; it is never joined.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def settle(result, error):
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    
+    def run():
+        result, error = None, None
+        try:
+            result = fn(**kwargs)
+        except Exception as e:
+            error = e
+        try:
+            loop.call_soon_threadsafe(settle, result, error)
+        except RuntimeError:
+            pass  # The loop has closed since the search was abandoned
+    
+    threading.Thread(target=run, name=f"{fn.__name__}-search", daemon=True).start()
+    return future
+
+
 class JobSpyScraper(BaseScraper):
     """
     Multi-source scraper using JobSpy library.
@@ -26,6 +63,9 @@ class JobSpyScraper(BaseScraper):
     
     name = "jobspy"
     
+    # Each search hits several job boards through a synchronous library
+    timeout = 900.0
+    
     # Search queries focused on "Lazy Girl Jobs"
     searches = [
         "remote customer support",
@@ -38,48 +78,54 @@ class JobSpyScraper(BaseScraper):
     # Sites to scrape
     sites = ["indeed", "zip_recruiter", "glassdoor"]  # LinkedIn requires login
     
-    async def scrape(self) -> list[Job]:
-        """Scrape jobs using JobSpy."""
+    # Each search fans out to every site; replaces the fixed two-second pause
+    max_per_host = 2
+    requests_per_second = 0.5
+    
+    async def stream(self) -> AsyncIterator[list[Job]]:
+        """Yield jobs from JobSpy one search at a time."""
         if not JOBSPY_AVAILABLE:
             print("JobSpy not installed. Run: pip install python-jobspy")
-            return []
+            return
         
-        jobs = []
         seen_ids = set()
         
-        for search_query in self.searches:
-            try:
-                # Use sync function in async context
-                import asyncio
-                df = await asyncio.to_thread(
-                    scrape_jobs,
-                    site_name=self.sites,
-                    search_term=search_query,
-                    location="",  # Empty for remote
-                    is_remote=True,
-                    results_wanted=25,  # Per site per search
-                    hours_old=168,  # Last 7 days
-                    country_indeed='USA',
-                )
-                
-                for _, row in df.iterrows():
-                    job = self._parse_row(row)
-                    if job and job.source_id not in seen_ids:
-                        job.category = self.categorize(job)
-                        job.is_no_phone = self.detect_no_phone(job)
-                        jobs.append(job)
-                        seen_ids.add(job.source_id)
-                
-                # Rate limiting
-                import asyncio
-                await asyncio.sleep(2)
-                
-            except Exception as e:
-                print(f"Error searching JobSpy for '{search_query}': {e}")
+        pages = self.iter_pages(
+            (search_query, self._search(search_query)) for search_query in self.searches
+        )
+        async for search_query, df in pages:
+            if isinstance(df, Exception):
+                print(f"Error searching JobSpy for '{search_query}': {df}")
                 continue
-        
-        self.jobs = jobs
-        return jobs
+            
+            jobs = []
+            for _, row in df.iterrows():
+                job = self._parse_row(row)
+                if job and job.source_id not in seen_ids:
+                    job.category = self.categorize(job)
+                    job.is_no_phone = self.detect_no_phone(job)
+                    jobs.append(job)
+                    seen_ids.add(job.source_id)
+            self.progress.jobs_parsed += len(jobs)
+            yield jobs
+    
+    async def _search(self, search_query: str):
+        """Run one JobSpy search in a daemon thread, within the scheduler's jobspy slot."""
+        async with self.scheduler.slot(self.name, self.max_per_host, self.requests_per_second):
+            # Use sync function in async context
+            df = await _run_in_daemon_thread(
+                scrape_jobs,
+                site_name=self.sites,
+                search_term=search_query,
+                location="",  # Empty for remote
+                is_remote=True,
+                results_wanted=25,  # Per site per search
+                hours_old=168,  # Last 7 days
+                country_indeed='USA',
+            )
+        self.report_limits(self.name)
+        self.progress.pages_fetched += 1
+        return df
     
     def _parse_row(self, row) -> Optional[Job]:
         """Parse DataFrame row into Job object."""
@@ -2,7 +2,7 @@
 
 import httpx
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, Optional
 import re
 from .base import BaseScraper, Job
 
@@ -32,73 +32,69 @@ class RedditScraper(BaseScraper):
         '$', 'per hour', '/hr', 'salary', 'compensation'
     ]
     
-    async def scrape(self) -> list[Job]:
-        """Scrape job posts from Reddit."""
-        jobs = []
-        seen_ids = set()
-        
-        async with httpx.AsyncClient() as client:
-            for subreddit in self.subreddits:
-                try:
-                    subreddit_jobs = await self._scrape_subreddit(client, subreddit)
-                    
-                    for job in subreddit_jobs:
-                        if job.source_id not in seen_ids:
-                            job.category = self.categorize(job)
-                            job.is_no_phone = self.detect_no_phone(job)
-                            jobs.append(job)
-                            seen_ids.add(job.source_id)
-                    
-                    # Rate limiting for Reddit
-                    import asyncio
-                    await asyncio.sleep(1)
-                    
-                except Exception as e:
-                    print(f"Error scraping r/{subreddit}: {e}")
-                    continue
-        
-        self.jobs = jobs
-        return jobs
+    # Listings fetched per subreddit
+    sorts = ['hot', 'new']
     
-    async def _scrape_subreddit(self, client: httpx.AsyncClient, subreddit: str) -> list[Job]:
-        """Scrape a single subreddit."""
-        jobs = []
+    # Unauthenticated JSON API; replaces the fixed one-second pause per subreddit
+    max_per_host = 2
+    requests_per_second = 1.0
+    
+    async def stream(self) -> AsyncIterator[list[Job]]:
+        """Yield job posts from Reddit one listing at a time."""
+        seen_ids = set()
         
-        # Get hot and new posts
-        for sort in ['hot', 'new']:
-            try:
-                url = f"{self.base_url}/r/{subreddit}/{sort}.json"
-                
-                response = await client.get(
-                    url,
-                    params={
-                        'limit': 50,
-                        't': 'week',  # Time filter
-                    },
-                    headers={
-                        'User-Agent': 'RemoteJobScraper/1.0 (educational project)',
-                    },
-                    timeout=30.0,
-                    follow_redirects=True
-                )
-                
-                if response.status_code != 200:
+        async with self.session() as client:
+            pages = self.iter_pages(
+                ((subreddit, sort), self._scrape_listing(client, subreddit, sort))
+                for subreddit in self.subreddits for sort in self.sorts
+            )
+            async for (subreddit, sort), listing_jobs in pages:
+                if isinstance(listing_jobs, Exception):
+                    print(f"Error fetching r/{subreddit}/{sort}: {listing_jobs}")
                     continue
                 
-                data = response.json()
-                posts = data.get('data', {}).get('children', [])
-                
-                for post in posts:
-                    post_data = post.get('data', {})
-                    job = self._parse_post(post_data, subreddit)
-                    if job:
+                jobs = []
+                for job in listing_jobs:
+                    if job.source_id not in seen_ids:
+                        job.category = self.categorize(job)
+                        job.is_no_phone = self.detect_no_phone(job)
                         jobs.append(job)
-                        
-            except Exception as e:
-                print(f"Error fetching r/{subreddit}/{sort}: {e}")
-                continue
-        
-        return jobs
+                        seen_ids.add(job.source_id)
+                self.progress.jobs_parsed += len(jobs)
+                yield jobs
+    
+    async def _scrape_listing(self, client: httpx.AsyncClient, subreddit: str, sort: str) -> list[Job]:
+        """Scrape one listing (hot, new) of a subreddit."""
+        def parse(response: httpx.Response) -> list[Job]:
+            jobs = []
+            
+            if response.status_code != 200:
+                return jobs
+            self.progress.pages_fetched += 1
+            
+            data = response.json()
+            posts = data.get('data', {}).get('children', [])
+            
+            for post in posts:
+                post_data = post.get('data', {})
+                job = self._parse_post(post_data, subreddit)
+                if job:
+                    jobs.append(job)
+            
+            return jobs
+        
+        return await self.fetch_page(
+            client,
+            f"{self.base_url}/r/{subreddit}/{sort}.json",
+            parse,
+            params={
+                'limit': 50,
+                't': 'week',  # Time filter
+            },
+            headers={
+                'User-Agent': 'RemoteJobScraper/1.0 (educational project)',
+            },
+        )
     
     def _parse_post(self, data: dict, subreddit: str) -> Optional[Job]:
         """Parse a Reddit post into a Job if it looks like a job posting."""
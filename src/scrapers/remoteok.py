@@ -2,7 +2,7 @@
 
 import httpx
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, Optional
 from .base import BaseScraper, Job
 
 
@@ -18,20 +18,25 @@ class RemoteOKScraper(BaseScraper):
     base_url = "https://remoteok.com"
     api_url = "https://remoteok.com/api"
     
-    async def scrape(self) -> list[Job]:
-        """Fetch jobs from RemoteOK API."""
-        jobs = []
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
+    async def stream(self) -> AsyncIterator[list[Job]]:
+        """Fetch jobs from RemoteOK API (a single page)."""
+        async with self.session() as client:
+            jobs = await self.fetch_page(
+                client,
                 self.api_url,
+                self._parse_api,
                 headers={
                     'User-Agent': 'RemoteJobScraper/1.0 (https://github.com/jaume/remote-job-scraper)'
                 },
-                timeout=30.0
             )
-            response.raise_for_status()
-            data = response.json()
+        yield jobs
+    
+    def _parse_api(self, response: httpx.Response) -> list[Job]:
+        """Parse the API payload into jobs."""
+        jobs = []
+        response.raise_for_status()
+        self.progress.pages_fetched += 1
+        data = response.json()
         
         # First item is legal/terms notice, skip it
         for item in data[1:]:
@@ -42,11 +47,11 @@ class RemoteOKScraper(BaseScraper):
                     job.category = self.categorize(job)
                     job.is_no_phone = self.detect_no_phone(job)
                     jobs.append(job)
+                    self.progress.jobs_parsed = len(jobs)
             except Exception as e:
                 print(f"Error parsing job {item.get('id', 'unknown')}: {e}")
                 continue
         
-        self.jobs = jobs
         return jobs
     
     def _parse_job(self, data: dict) -> Optional[Job]:
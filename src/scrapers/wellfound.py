@@ -7,7 +7,7 @@ Uses their public job listing pages.
 import httpx
 from bs4 import BeautifulSoup
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, Optional
 import re
 import json
 from .base import BaseScraper, Job
@@ -35,48 +35,50 @@ class WellfoundScraper(BaseScraper):
         "product",
     ]
     
-    async def scrape(self) -> list[Job]:
-        """Scrape jobs from Wellfound."""
-        jobs = []
+    # Replaces the fixed one-second pause between categories
+    max_per_host = 2
+    requests_per_second = 1.0
+    
+    async def stream(self) -> AsyncIterator[list[Job]]:
+        """Yield jobs from Wellfound one category page at a time."""
         seen_ids = set()
         
-        async with httpx.AsyncClient() as client:
-            for category in self.categories:
-                try:
-                    url = f"{self.base_url}/role/r/{category}?remote=true"
-                    
-                    response = await client.get(
-                        url,
-                        headers={
-                            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                            'Accept': 'text/html,application/xhtml+xml',
-                        },
-                        timeout=30.0,
-                        follow_redirects=True
-                    )
-                    
-                    if response.status_code != 200:
-                        continue
-                    
-                    category_jobs = self._parse_listing(response.text, category)
-                    
-                    for job in category_jobs:
-                        if job.source_id not in seen_ids:
-                            job.category = self.categorize(job)
-                            job.is_no_phone = self.detect_no_phone(job)
-                            jobs.append(job)
-                            seen_ids.add(job.source_id)
-                    
-                    # Rate limiting
-                    import asyncio
-                    await asyncio.sleep(1)
-                    
-                except Exception as e:
-                    print(f"Error scraping Wellfound {category}: {e}")
+        async with self.session() as client:
+            pages = self.iter_pages(
+                (category, self._fetch_category(client, category)) for category in self.categories
+            )
+            async for category, category_jobs in pages:
+                if isinstance(category_jobs, Exception):
+                    print(f"Error scraping Wellfound {category}: {category_jobs}")
                     continue
-        
-        self.jobs = jobs
-        return jobs
+                
+                jobs = []
+                for job in category_jobs:
+                    if job.source_id not in seen_ids:
+                        job.category = self.categorize(job)
+                        job.is_no_phone = self.detect_no_phone(job)
+                        jobs.append(job)
+                        seen_ids.add(job.source_id)
+                self.progress.jobs_parsed += len(jobs)
+                yield jobs
+    
+    async def _fetch_category(self, client: httpx.AsyncClient, category: str) -> list[Job]:
+        """Fetch and parse one category page; empty if the page is unavailable."""
+        def parse(response: httpx.Response) -> list[Job]:
+            if response.status_code != 200:
+                return []
+            self.progress.pages_fetched += 1
+            return self._parse_listing(response.text, category)
+        
+        return await self.fetch_page(
+            client,
+            f"{self.base_url}/role/r/{category}?remote=true",
+            parse,
+            headers={
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+                'Accept': 'text/html,application/xhtml+xml',
+            },
+        )
     
     def _parse_listing(self, html: str, category: str) -> list[Job]:
         """Parse job listing page."""
@@ -3,7 +3,7 @@
 import httpx
 from bs4 import BeautifulSoup
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, Optional
 import re
 from .base import BaseScraper, Job
 
@@ -33,41 +33,49 @@ class WeWorkRemotelyScraper(BaseScraper):
         "/categories/remote-data-jobs",
     ]
     
-    async def scrape(self) -> list[Job]:
-        """Scrape jobs from WeWorkRemotely."""
-        jobs = []
+    max_per_host = 3
+    requests_per_second = 2.0
+    
+    async def stream(self) -> AsyncIterator[list[Job]]:
+        """Yield jobs from WeWorkRemotely one category page at a time."""
         seen_urls = set()
         
-        async with httpx.AsyncClient() as client:
-            for category_path in self.categories:
-                try:
-                    url = f"{self.base_url}{category_path}"
-                    response = await client.get(
-                        url,
-                        headers={
-                            'User-Agent': 'Mozilla/5.0 (compatible; RemoteJobScraper/1.0)'
-                        },
-                        timeout=30.0,
-                        follow_redirects=True
-                    )
-                    response.raise_for_status()
-                    
-                    category_jobs = self._parse_listing(response.text, category_path)
-                    
-                    for job in category_jobs:
-                        if job.url not in seen_urls:
-                            # Auto-categorize and detect no-phone
-                            job.category = self.categorize(job)
-                            job.is_no_phone = self.detect_no_phone(job)
-                            jobs.append(job)
-                            seen_urls.add(job.url)
-                            
-                except Exception as e:
-                    print(f"Error scraping {category_path}: {e}")
+        async with self.session() as client:
+            pages = self.iter_pages(
+                (category_path, self._fetch_category(client, category_path))
+                for category_path in self.categories
+            )
+            async for category_path, category_jobs in pages:
+                if isinstance(category_jobs, Exception):
+                    print(f"Error scraping {category_path}: {category_jobs}")
                     continue
-        
-        self.jobs = jobs
-        return jobs
+                
+                jobs = []
+                for job in category_jobs:
+                    if job.url not in seen_urls:
+                        # Auto-categorize and detect no-phone
+                        job.category = self.categorize(job)
+                        job.is_no_phone = self.detect_no_phone(job)
+                        jobs.append(job)
+                        seen_urls.add(job.url)
+                self.progress.jobs_parsed += len(jobs)
+                yield jobs
+    
+    async def _fetch_category(self, client: httpx.AsyncClient, category_path: str) -> list[Job]:
+        """Fetch and parse one category page."""
+        def parse(response: httpx.Response) -> list[Job]:
+            response.raise_for_status()
+            self.progress.pages_fetched += 1
+            return self._parse_listing(response.text, category_path)
+        
+        return await self.fetch_page(
+            client,
+            f"{self.base_url}{category_path}",
+            parse,
+            headers={
+                'User-Agent': 'Mozilla/5.0 (compatible; RemoteJobScraper/1.0)'
+            },
+        )
     
     def _parse_listing(self, html: str, category: str) -> list[Job]:
         """Parse job listing page."""
@@ -0,0 +1,32 @@
+"""Tests for JobDatabase.search_jobs."""
+
+import src.database as database
+from src.database import JobDatabase
+
+
+def _job(i: int, title: str) -> dict:
+    return {
+        'id': f'test_{i}',
+        'source': 'test',
+        'source_id': str(i),
+        'title': title,
+        'company': 'Acme',
+        'url': f'https://example.com/{i}',
+        'description': 'Answer customer emails from home.',
+    }
+
+
+def test_inactive_matches_do_not_crowd_out_active_ones(tmp_path, monkeypatch):
+    monkeypatch.setattr(database, 'SEARCH_CANDIDATES', 5)
+    db = JobDatabase(str(tmp_path / 'jobs.db'))
+
+    # The active match is inserted first, so every inactive match is newer than it
+    db.bulk_upsert_jobs([_job(0, 'Support agent')])
+    db.bulk_upsert_jobs([_job(i, 'Support agent') for i in range(1, 21)])
+    with db.conn:
+        db.conn.execute("UPDATE jobs SET is_active = 0 WHERE id != 'test_0'")
+
+    results = db.search_jobs('support', limit=10)
+
+    assert [job['id'] for job in results] == ['test_0']
+    db.close()